@@ -1,7 +1,19 @@
+import asyncio
+
 from .app import FlotteApp
 
 
+def _install_event_loop() -> None:
+    """Use uvloop for the asyncio event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return  # Optional speedup (not available on Windows)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
+    _install_event_loop()
     app = FlotteApp()
     app.run()
 
@@ -1,19 +1,26 @@
 import asyncio
+import functools
+import os
+import shlex
+import subprocess
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Center, Container, Horizontal, Vertical
 from textual.widgets import Button, Static, Select
 from textual import on, work
+from textual.timer import Timer
 
 from .config import load_config, Project as ConfigProject
 from .theme import load_theme_colors
 from .models import Worktree
 from .models.project import Project
 from .models.worktree import WorktreeStatus
-from .messages import OperationCompleted, WorktreeStatusChanged
-from .services import RideWrapper, WorktreeManager
+from .messages import OperationCompleted, WorktreesPolled
+from .services import DockerManager, RideWrapper, WorktreeManager
 from .screens import (
     ConfirmDialog,
     CreateWorktreeScreen,
@@ -34,6 +41,12 @@ from .widgets import (
 from . import __version__
 
 
+@functools.lru_cache(maxsize=8)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Split a configured shell command into argv (cached per command string)."""
+    return tuple(shlex.split(command))
+
+
 class FlotteApp(App):
     """Flotte - Manage docker-compose projects across git worktrees."""
 
@@ -56,6 +69,41 @@ class FlotteApp(App):
         Binding("escape", "deselect", show=False),
     ]
 
+    # Seconds an operation's transient status may outlive its compose command
+    OPERATION_GRACE_PERIOD = 30.0
+
+    # Button id -> action method name
+    _BUTTON_ACTIONS = {
+        "btn-new-worktree": "action_new_worktree",
+        "btn-refresh": "action_refresh",
+        "btn-help": "action_show_help",
+        "btn-container-start": "action_start_environment",
+        "btn-container-stop": "action_stop_environment",
+        "btn-container-restart": "action_restart_environment",
+        "btn-ride": "action_ride",
+        "btn-delete-worktree": "action_delete_worktree",
+    }
+
+    # Operation -> RideWrapper commands run in order
+    _OPERATION_PHASES = {
+        "start": ("start",),
+        "stop": ("down",),
+        "restart": ("stop", "start"),
+    }
+
+    # Command -> (transient status while running, status that completes it)
+    _OPERATION_STATUSES = {
+        "start": (WorktreeStatus.STARTING, WorktreeStatus.RUNNING),
+        "down": (WorktreeStatus.STOPPING, WorktreeStatus.STOPPED),
+        "stop": (WorktreeStatus.STOPPING, WorktreeStatus.STOPPED),
+    }
+
+    # Transient status -> verb used in the completion notification
+    _COMPLETION_VERBS = {
+        WorktreeStatus.STARTING: "Started",
+        WorktreeStatus.STOPPING: "Stopped",
+    }
+
     def __init__(self):
         # Load config first to determine theme
         self.config = load_config()
@@ -99,11 +147,27 @@ class FlotteApp(App):
 
         self.selected_worktree: Worktree | None = None
 
-        # Simple operation lock (prevents concurrent operations)
-        self._operation_in_progress: bool = False
+        # Operation lock (prevents concurrent operations)
+        self._op_lock = asyncio.Lock()
+        # Set by action handlers until their worker holds _op_lock, so a
+        # second key press before the worker runs is refused too
+        self._op_reserved = False
         self._operation_type: str | None = None  # "create", "delete", "start", "stop", "restart"
         self._operation_target: str | None = None  # worktree name
 
+        # Pending transient-status expiry timers, keyed by worktree name
+        self._transient_timers: dict[str, Timer] = {}
+
+        # Whether a git status fetch is running (see _refresh_git_status)
+        self._git_status_fetching = False
+
+        # One RideWrapper per worktree name (dropped on delete/project switch)
+        self._ride_wrappers: dict[str, RideWrapper] = {}
+
+        # What the header and container view showed at the last status
+        # update, to skip redundant rebuilds
+        self._ui_fingerprint: tuple | None = None
+
     def compose(self) -> ComposeResult:
         # Show no-config screen if no projects configured
         if not self.config.projects:
@@ -158,52 +222,79 @@ class FlotteApp(App):
 
     # Operation lock helpers
 
-    def _acquire_operation_lock(self, op_type: str, target: str) -> bool:
-        """Try to acquire operation lock. Returns True if acquired.
+    def _operation_busy(self) -> bool:
+        """Whether an operation holds or has reserved the operation lock."""
+        return self._op_reserved or self._op_lock.locked()
 
-        MUST be called from sync context (action methods, callbacks).
-        """
-        if self._operation_in_progress:
+    def _can_begin_operation(self) -> bool:
+        """Check no operation is running or pending, warning the user if one is."""
+        if self._operation_busy():
             self.notify("Operation in progress", severity="warning")
             return False
-
-        self._operation_in_progress = True
-        self._operation_type = op_type
-        self._operation_target = target
-        self._update_container_view()
-        self.log.info(f"Lock acquired: {op_type} on {target}")
         return True
 
-    def _release_operation_lock(self) -> None:
-        """Release operation lock.
+    @asynccontextmanager
+    async def _operation(self, op_type: str, target: str) -> AsyncIterator[None]:
+        """Hold the operation lock for the duration of an operation.
 
-        Safe to call even if lock not held (idempotent).
+        Args:
+            op_type: Operation name, for UI state and logging
+            target: Name of the worktree being operated on
         """
-        if not self._operation_in_progress:
-            return  # Already released, nothing to do
-
-        op_type = self._operation_type
-        target = self._operation_target
+        async with self._op_lock:
+            self._op_reserved = False
+            self._operation_type = op_type
+            self._operation_target = target
+            self._refresh_operation_target(target)
+            self.log.info("Lock acquired:", op_type, "on", target)
+            try:
+                yield
+            finally:
+                self._operation_type = None
+                self._operation_target = None
+                self._clear_progress_view()
+                self._refresh_operation_target(target)
+                self.log.info("Lock released:", op_type, "on", target)
+
+    def _refresh_operation_target(self, target: str | None) -> None:
+        """Refresh the views showing an operation's target worktree.
+
+        The header row is always redrawn; the container view only shows the
+        selected worktree.
+        """
+        if self.project and target in self.project.worktrees:
+            self._update_header_status(self.project.worktrees[target])
+        if self.selected_worktree and self.selected_worktree.name == target:
+            self._update_container_view()
 
-        self._operation_in_progress = False
-        self._operation_type = None
-        self._operation_target = None
-        self._clear_progress_view()
+    def _show_operation_started(self, wt: Worktree) -> None:
+        """Reflect a newly started operation in the header row and container view."""
+        self._update_header_status(wt)
         self._update_container_view()
-        self.log.info(f"Lock released: {op_type} on {target}")
+
+    def _update_header_status(self, wt: Worktree) -> None:
+        """Redraw one header row's status icon outside the poll update path.
+
+        A poll that finds no Docker changes posts nothing to redraw, so
+        transient statuses are written and restored here directly.
+        """
+        self._header.update_status_for(wt)
+        # The header no longer matches the fingerprint of the last update
+        self._ui_fingerprint = None
+
+    def _request_poll(self) -> None:
+        """Ask the project poller to refresh container status now."""
+        if self.project:
+            self.project.request_poll()
 
     def _clear_progress_view(self) -> None:
         """Clear the progress view after operation completes."""
-        try:
-            progress = self.query_one("#progress-view", ProgressView)
-            progress.clear()
-        except Exception:
-            pass  # Progress view may not exist
+        self._progress.clear()
 
     @on(Select.Changed, "#project-selector")
     def on_project_changed(self, event: Select.Changed) -> None:
         """Handle project selection change."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Cannot switch project during operation", severity="warning")
             # Reset selector to current project
             self.query_one("#project-selector", Select).value = self.current_config_project
@@ -228,8 +319,12 @@ class FlotteApp(App):
             config_project.ride_command,
         )
 
-        # Reset selection
+        # Reset selection and per-worktree caches
         self.selected_worktree = None
+        self._ride_wrappers.clear()
+        DockerManager.clear_services_cache()
+        for name in list(self._transient_timers):
+            self._cancel_transient_expiry(name)
 
         # Create new WorktreeManager for new project
         self.worktree_manager = WorktreeManager(
@@ -250,28 +345,25 @@ class FlotteApp(App):
     def _clear_ui_state(self) -> None:
         """Clear all UI widgets to blank state."""
         # Clear worktree header
-        header = self.query_one("#worktree-header", WorktreeHeader)
-        header.refresh_worktrees([])
+        self._header.refresh_worktrees([])
+        self._ui_fingerprint = None
 
         # Clear container table by setting worktree to None
-        container_table = self.query_one("#container-table", ContainerTable)
-        container_table.worktree = None
+        self._table.worktree = None
 
         # Reset status line
-        status_line = self.query_one("#status-line", StatusLine)
-        status_line.status = WorktreeStatus.UNKNOWN
+        self._status_line.status = WorktreeStatus.UNKNOWN
 
         # Hide progress/error views
-        self.query_one("#progress-view", ProgressView).display = False
-        self.query_one("#error-view", ErrorView).display = False
+        self._progress.display = False
+        self._error.display = False
 
         # Reset controls
-        controls = self.query_one("#container-controls", ContainerControls)
-        controls.status = WorktreeStatus.UNKNOWN
-        controls.is_main = False
+        self._controls.status = WorktreeStatus.UNKNOWN
+        self._controls.is_main = False
 
         # Reset container box title
-        self.query_one("#containers-box").border_title = "Containers"
+        self._box.border_title = "Containers"
 
     def on_mount(self) -> None:
         """Initialize app and start polling."""
@@ -280,12 +372,21 @@ class FlotteApp(App):
             self.query_one("#quit-btn", Button).focus()
             return
 
+        # Cache widget handles used on every status update
+        self._header = self.query_one("#worktree-header", WorktreeHeader)
+        self._status_line = self.query_one("#status-line", StatusLine)
+        self._table = self.query_one("#container-table", ContainerTable)
+        self._progress = self.query_one("#progress-view", ProgressView)
+        self._error = self.query_one("#error-view", ErrorView)
+        self._controls = self.query_one("#container-controls", ContainerControls)
+        self._box = self.query_one("#containers-box")
+
         self.query_one("#worktrees-box").border_title = "Worktrees"
-        self.query_one("#containers-box").border_title = "Containers"
+        self._box.border_title = "Containers"
 
         # Set initial display states
-        self.query_one("#progress-view").display = False
-        self.query_one("#error-view").display = False
+        self._progress.display = False
+        self._error.display = False
 
         self.run_worker(self.refresh_worktrees())
 
@@ -304,68 +405,88 @@ class FlotteApp(App):
         discovered = await self.worktree_manager.discover_worktrees()
 
         # Copy discovered worktrees to Project model
-        self.project.worktrees.clear()
-        for wt in discovered:
-            self.project.worktrees[wt.name] = wt
-
-        # Pre-fetch volumes so they're cached for worktree creation
-        await self.worktree_manager.get_volumes()
+        self.project.set_worktrees(discovered)
 
         # Update header dropdown
-        header = self.query_one("#worktree-header", WorktreeHeader)
-        header.refresh_worktrees(list(self.project.worktrees.values()))
-
-        # Auto-select first worktree if none selected
-        if self.project.worktrees and self.selected_worktree is None:
-            first_wt = list(self.project.worktrees.values())[0]
-            self.selected_worktree = first_wt
-            header.select_worktree(self.selected_worktree)
-            self.query_one("#containers-box").border_title = self.selected_worktree.name
-            table = self.query_one("#container-table", ContainerTable)
-            table.worktree = self.selected_worktree
-
-        # Poll once immediately to get initial status
-        if self.project:
-            await self.project.poll_once()
-            self._update_ui_after_status_change()
+        self._header.refresh_worktrees(self.project.worktree_list)
+
+        # Discovery replaced the Worktree objects: follow the selection to
+        # its new object, or auto-select the first worktree if there is none
+        selected = self.selected_worktree and self.project.get_fresh(self.selected_worktree)
+        if selected is None and self.project.worktrees:
+            selected = self.project.worktree_list[0]
+        self.selected_worktree = selected
+        if selected is not None:
+            self._header.select_worktree(selected)
+        self._table.worktree = selected
+        self._update_box_title()
+
+        # Have the poll loop poll immediately rather than polling here
+        # concurrently with it (the poll posts WorktreesPolled, which
+        # refreshes the UI)
+        self._request_poll()
+
+        # Pre-fetch volumes so they're cached for worktree creation. Done
+        # last: docker compose config is slow and nothing on screen needs it.
+        await self.worktree_manager.get_volumes()
 
     def _sync_worktree_ui(self) -> None:
         """Update UI from existing worktrees (no discovery)."""
         if not self.project:
             return
-        header = self.query_one("#worktree-header", WorktreeHeader)
-        header.refresh_worktrees(list(self.project.worktrees.values()))
+        self._header.refresh_worktrees(self.project.worktree_list)
 
-    def on_worktree_status_changed(self, event: WorktreeStatusChanged) -> None:
-        """Handle worktree status change from polling."""
-        self._update_ui_after_status_change()
+    def on_worktrees_polled(self, event: WorktreesPolled) -> None:
+        """Handle a completed poll."""
+        if event.changed:
+            self._update_ui_after_status_change()
+        # Git status isn't part of the poll, so refresh it every time
+        self._refresh_git_status()
 
     def on_operation_completed(self, event: OperationCompleted) -> None:
         """Handle operation completion - show notification."""
-        wt = event.worktree
-        if event.operation == WorktreeStatus.STARTING:
-            self.notify(f"Started {wt.name}", severity="information")
-        elif event.operation == WorktreeStatus.STOPPING:
-            self.notify(f"Stopped {wt.name}", severity="information")
+        # The poll that cleared the transient may report no Docker changes
+        # (e.g. Stop on a stopped worktree), so restore the row here
+        self._refresh_operation_target(event.worktree.name)
+        verb = self._COMPLETION_VERBS.get(event.operation)
+        if verb:
+            self.notify(f"{verb} {event.worktree.name}", severity="information")
 
     def _update_ui_after_status_change(self) -> None:
         """Update UI elements after status change."""
         if not self.project:
             return
 
-        header = self.query_one("#worktree-header", WorktreeHeader)
-        header.refresh_worktrees(list(self.project.worktrees.values()))
-
+        # Follow the selection to its current object (None once removed)
         if self.selected_worktree:
-            wt_name = self.selected_worktree.name
-            fresh_wt = self.project.worktrees.get(wt_name)
-            if fresh_wt is None:
-                self.selected_worktree = None
-            else:
-                # Selected worktree is the same object (no replacement)
-                table = self.query_one("#container-table", ContainerTable)
-                table.worktree = self.selected_worktree
-                self.run_worker(self._fetch_git_status())
+            self.selected_worktree = self.project.get_fresh(self.selected_worktree)
+        selected = self.selected_worktree
+
+        # Skip the update entirely when nothing shown has changed since the
+        # last one. A poll reports a worktree as changed whenever its Docker
+        # data moved, which often leaves everything shown as it was (e.g. a
+        # container of an unselected worktree changing without its status
+        # or URL changing, or a container being recreated under a new ID)
+        worktrees = self.project.worktree_list
+        header_fp = tuple((wt.name, wt.status, wt.web_url) for wt in worktrees)
+        selected_fp = selected and (
+            selected.name,
+            tuple(
+                (c.service, c.state, c.status, c.name, tuple(c.ports))
+                for c in selected.container_list
+            ),
+        )
+        fingerprint = (header_fp, selected_fp)
+        if fingerprint == self._ui_fingerprint:
+            return
+
+        # Only rebuild the header table when a row's status or URL changed
+        if self._ui_fingerprint is None or header_fp != self._ui_fingerprint[0]:
+            self._header.refresh_worktrees(worktrees)
+        self._ui_fingerprint = fingerprint
+
+        if selected:
+            self._table.worktree = selected
 
         self._update_container_view()
 
@@ -379,41 +500,38 @@ class FlotteApp(App):
         """Show/hide container box widgets based on effective status."""
         status = self._effective_status()
 
-        self.query_one("#status-line", StatusLine).status = status
+        self._status_line.status = status
 
         # Show table for container-related states, progress for create/delete
         # During DELETING, show table so user sees containers disappearing
         show_table = status != WorktreeStatus.CREATING
         show_progress = status == WorktreeStatus.CREATING
 
-        self.query_one("#container-table").display = show_table
-        self.query_one("#progress-view").display = show_progress
-        self.query_one("#error-view").display = False  # Errors shown via notify
+        self._table.display = show_table
+        self._progress.display = show_progress
+        self._error.display = False  # Errors shown via notify
 
-        controls = self.query_one("#container-controls", ContainerControls)
-        controls.status = status
-        controls.is_main = self.selected_worktree.is_main if self.selected_worktree else False
+        self._controls.status = status
+        self._controls.is_main = self.selected_worktree.is_main if self.selected_worktree else False
 
         self._update_box_title()
 
     def _update_box_title(self) -> None:
         """Update containers-box border title to show selected worktree name."""
-        box = self.query_one("#containers-box")
         if self.selected_worktree:
-            box.border_title = self.selected_worktree.name
+            self._box.border_title = self.selected_worktree.name
         else:
-            box.border_title = "Containers"
+            self._box.border_title = "Containers"
 
     def on_worktree_changed(self, event: WorktreeChanged) -> None:
         """Handle worktree selection from dropdown."""
         if not self.project:
             return
-        fresh_wt = self.project.worktrees.get(event.worktree.name)
         # Use fresh object if available
-        self.selected_worktree = fresh_wt if fresh_wt else event.worktree
+        self.selected_worktree = self.project.get_fresh(event.worktree) or event.worktree
 
-        self.run_worker(self._fetch_git_status())
-        self.query_one("#container-table", ContainerTable).worktree = self.selected_worktree
+        self._refresh_git_status()
+        self._table.worktree = self.selected_worktree
         self._update_container_view()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -423,173 +541,157 @@ class FlotteApp(App):
             self.exit()
             return
 
-        button_actions = {
-            "btn-new-worktree": self.action_new_worktree,
-            "btn-refresh": self.action_refresh,
-            "btn-help": self.action_show_help,
-            "btn-container-start": self.action_start_environment,
-            "btn-container-stop": self.action_stop_environment,
-            "btn-container-restart": self.action_restart_environment,
-            "btn-ride": self.action_ride,
-            "btn-delete-worktree": self.action_delete_worktree,
-        }
-        action = button_actions.get(event.button.id)
+        action = self._BUTTON_ACTIONS.get(event.button.id)
         if action:
-            action()
+            getattr(self, action)()
+
+    def _refresh_git_status(self) -> None:
+        """Fetch git status for the selected worktree in the background.
+
+        Requests made while a fetch is running are skipped rather than
+        cancelling it: on a large repo frequent polls would otherwise never
+        let a fetch finish, and git killed mid-run can leave a stale lock.
+        """
+        if self._git_status_fetching:
+            return
+        self._git_status_fetching = True
+        self.run_worker(self._fetch_git_status(), group="git-status")
 
     async def _fetch_git_status(self) -> None:
         """Fetch git status asynchronously and update display."""
-        if not self.selected_worktree:
-            return
-        git_status = await self.worktree_manager.get_git_status(self.selected_worktree)
-        header = self.query_one("#worktree-header", WorktreeHeader)
-        header.update_git_status(git_status)
+        wt = self.selected_worktree
+        try:
+            if not wt:
+                return
+            git_status = await self.worktree_manager.get_git_status(wt)
+        finally:
+            self._git_status_fetching = False
+
+        if self.selected_worktree and self.selected_worktree.name == wt.name:
+            self._header.update_git_status(git_status)
+        elif self.selected_worktree:
+            # The selection moved while git ran and its request was skipped
+            self._refresh_git_status()
 
     # Action methods
 
     def action_refresh(self) -> None:
         """Refresh worktree list and container status."""
+        # Re-read service lists too, e.g. after editing an included file
+        DockerManager.clear_services_cache()
         self.run_worker(self.refresh_worktrees())
 
     def action_start_environment(self) -> None:
         """Start Docker environment."""
-        if self._operation_in_progress:
-            self.notify("Operation in progress", severity="warning")
-            return
         if not self.selected_worktree:
             return
 
         wt = self.selected_worktree
-        if not self._acquire_operation_lock("start", wt.name):
-            return
+        self._run_operation(wt, "start")
+
+    def _get_ride_wrapper(self, wt: Worktree) -> RideWrapper:
+        """Get the cached RideWrapper for a worktree, creating it on first use."""
+        wrapper = self._ride_wrappers.get(wt.name)
+        if wrapper is None:
+            wrapper = RideWrapper(wt.path, wt.compose_project_name)
+            self._ride_wrappers[wt.name] = wrapper
+        return wrapper
+
+    def _expire_transient_later(self, wt: Worktree) -> None:
+        """Clear wt's transient status if polling has not cleared it in time."""
+        self._cancel_transient_expiry(wt.name)
+        self._transient_timers[wt.name] = self.set_timer(
+            self.OPERATION_GRACE_PERIOD, lambda: self._expire_transient(wt)
+        )
+
+    def _cancel_transient_expiry(self, name: str) -> None:
+        """Cancel a pending transient expiry for a worktree, if any."""
+        timer = self._transient_timers.pop(name, None)
+        if timer is not None:
+            timer.stop()
+
+    def _expire_transient(self, wt: Worktree) -> None:
+        """Timer callback: drop a transient status that outlived the grace period."""
+        self._transient_timers.pop(wt.name, None)
+        if wt.clear_operation() is not None:
+            self.log.warning("Transient status expired:", wt.name)
+            self._update_header_status(wt)
+            self._update_ui_after_status_change()
 
-        self.run_worker(self._perform_start(wt), name="op-start", exclusive=False)
+    def _run_operation(self, wt: Worktree, op_type: str) -> None:
+        """Reserve the operation lock and run the operation in a worker.
 
-    async def _perform_start(self, wt: Worktree) -> None:
-        """Perform environment start. Lock must already be held."""
-        if not self._operation_in_progress:
-            self.log.error("_perform_start called without lock")
+        The reservation is taken synchronously, before the worker is
+        scheduled, and handed over once the worker acquires the lock.
+        """
+        if not self._can_begin_operation():
             return
 
-        wt.start_operation(WorktreeStatus.STARTING, WorktreeStatus.RUNNING)
-        self._update_container_view()
+        self._op_reserved = True
+        self.run_worker(self._perform_op(wt, op_type), name=f"op-{op_type}", exclusive=False)
 
-        try:
-            returncode, stdout, stderr = await RideWrapper(wt.path, wt.compose_project_name).start()
-            if returncode != 0:
-                self.log.error(f"Start failed: {stderr or stdout}")
-                self.notify(f"Failed to start: {stderr or stdout}", severity="error")
+    async def _perform_op(self, wt: Worktree, op_type: str) -> None:
+        """Perform a compose operation under the operation lock.
+
+        Args:
+            wt: Worktree to operate on
+            op_type: "start", "stop" or "restart"
+        """
+        self._cancel_transient_expiry(wt.name)
+        wrapper = self._get_ride_wrapper(wt)
+        phases = self._OPERATION_PHASES[op_type]
+        last = len(phases) - 1
+
+        async with self._operation(op_type, wt.name):
+            try:
+                for i, phase in enumerate(phases):
+                    # Only the final phase auto-clears when its target status is reached
+                    transient, target = self._OPERATION_STATUSES[phase]
+                    wt.start_operation(transient, target if i == last else None)
+                    self._show_operation_started(wt)
+                    self._request_poll()
+
+                    returncode, stdout, stderr = await getattr(wrapper, phase)()
+                    if returncode != 0:
+                        step = op_type if last == 0 else f"{op_type} ({phase} phase)"
+                        self.log.error(step, "failed:", stderr or stdout)
+                        self.notify(f"Failed to {op_type}: {stderr or stdout}", severity="error")
+                        wt.clear_operation()
+                        break  # Don't proceed to the next phase
+                else:
+                    # Don't leave the transient status up forever if the
+                    # target is never reached (e.g. a service crashes on start)
+                    self._expire_transient_later(wt)
+                # Success: poll will confirm the target status and post OperationCompleted
+                self._request_poll()
+            except asyncio.CancelledError:
+                self.log.warning(op_type, "cancelled:", wt.name)
+                wt.clear_operation()
+                raise
+            except Exception as e:
+                self.log.error(op_type, "failed:", e)
+                self.notify(f"Failed to {op_type}: {e}", severity="error")
                 wt.clear_operation()
-            # Success: poll will confirm when all services running and post OperationCompleted
-        except asyncio.CancelledError:
-            self.log.warning(f"Start cancelled: {wt.name}")
-            wt.clear_operation()
-            raise
-        except Exception as e:
-            self.log.error(f"Start failed: {e}")
-            self.notify(f"Failed to start: {e}", severity="error")
-            wt.clear_operation()
-        finally:
-            self._release_operation_lock()
 
     def action_stop_environment(self) -> None:
         """Stop Docker environment."""
-        if self._operation_in_progress:
-            self.notify("Operation in progress", severity="warning")
-            return
         if not self.selected_worktree:
             return
 
         wt = self.selected_worktree
-        if not self._acquire_operation_lock("stop", wt.name):
-            return
-
-        self.run_worker(self._perform_stop(wt), name="op-stop", exclusive=False)
-
-    async def _perform_stop(self, wt: Worktree) -> None:
-        """Perform environment stop. Lock must already be held."""
-        if not self._operation_in_progress:
-            self.log.error("_perform_stop called without lock")
-            return
-
-        wt.start_operation(WorktreeStatus.STOPPING, WorktreeStatus.STOPPED)
-        self._update_container_view()
-
-        try:
-            returncode, stdout, stderr = await RideWrapper(wt.path, wt.compose_project_name).stop()
-            if returncode != 0:
-                self.log.error(f"Stop failed: {stderr or stdout}")
-                self.notify(f"Failed to stop: {stderr or stdout}", severity="error")
-                wt.clear_operation()
-            # Success: poll will confirm when all services stopped and post OperationCompleted
-        except asyncio.CancelledError:
-            self.log.warning(f"Stop cancelled: {wt.name}")
-            wt.clear_operation()
-            raise
-        except Exception as e:
-            self.log.error(f"Stop failed: {e}")
-            self.notify(f"Failed to stop: {e}", severity="error")
-            wt.clear_operation()
-        finally:
-            self._release_operation_lock()
+        self._run_operation(wt, "stop")
 
     def action_restart_environment(self) -> None:
         """Restart Docker environment."""
-        if self._operation_in_progress:
-            self.notify("Operation in progress", severity="warning")
-            return
         if not self.selected_worktree:
             return
 
         wt = self.selected_worktree
-        if not self._acquire_operation_lock("restart", wt.name):
-            return
-
-        self.run_worker(self._perform_restart(wt), name="op-restart", exclusive=False)
-
-    async def _perform_restart(self, wt: Worktree) -> None:
-        """Perform environment restart. Lock must already be held."""
-        if not self._operation_in_progress:
-            self.log.error("_perform_restart called without lock")
-            return
-
-        try:
-            # Phase 1: Stop
-            wt.start_operation(WorktreeStatus.STOPPING, None)  # No auto-clear
-            self._update_container_view()
-
-            returncode, stdout, stderr = await RideWrapper(wt.path, wt.compose_project_name).stop()
-            if returncode != 0:
-                self.log.error(f"Restart (stop phase) failed: {stderr or stdout}")
-                self.notify(f"Failed to restart: {stderr or stdout}", severity="error")
-                wt.clear_operation()
-                return  # Don't proceed to start
-
-            # Phase 2: Start
-            wt.start_operation(WorktreeStatus.STARTING, WorktreeStatus.RUNNING)
-            self._update_container_view()
-
-            returncode, stdout, stderr = await RideWrapper(wt.path, wt.compose_project_name).start()
-            if returncode != 0:
-                self.log.error(f"Restart (start phase) failed: {stderr or stdout}")
-                self.notify(f"Failed to restart: {stderr or stdout}", severity="error")
-                wt.clear_operation()
-            # Success: poll will confirm when all containers running and post OperationCompleted
-
-        except asyncio.CancelledError:
-            self.log.warning(f"Restart cancelled: {wt.name}")
-            wt.clear_operation()
-            raise
-        except Exception as e:
-            self.log.error(f"Restart failed: {e}")
-            self.notify(f"Failed to restart: {e}", severity="error")
-            wt.clear_operation()
-        finally:
-            self._release_operation_lock()
+        self._run_operation(wt, "restart")
 
     def action_new_worktree(self) -> None:
         """Handle New button - opens dialog."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Operation in progress", severity="warning")
             return
 
@@ -611,15 +713,17 @@ class FlotteApp(App):
         if not self.project:
             return
         # Add the worktree to our project model
-        self.project.worktrees[worktree.name] = worktree
+        self.project.add_worktree(worktree)
         self._sync_worktree_ui()
         self.selected_worktree = worktree
-        self.query_one("#worktree-header", WorktreeHeader).select_worktree(worktree)
+        self._header.select_worktree(worktree)
+        # Populate the new worktree's containers without rediscovering the rest
+        self._request_poll()
         self.notify(f"Created {worktree.name}", severity="information")
 
     def action_delete_worktree(self) -> None:
         """Handle Delete button."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Operation in progress", severity="warning")
             return
         if not self.selected_worktree or not self.project:
@@ -653,7 +757,7 @@ class FlotteApp(App):
                 return
 
             # If an operation started while we were checking, abort
-            if self._operation_in_progress:
+            if self._operation_busy():
                 self.log.debug("Operation started during _prepare_delete, aborting")
                 return
 
@@ -664,11 +768,6 @@ class FlotteApp(App):
                 git_status["untracked"] > 0
             )
 
-            # Check again after async call
-            if self._operation_in_progress:
-                self.log.debug("Operation started during git status check, aborting")
-                return
-
             if has_changes:
                 changes = []
                 if git_status["staged"] > 0:
@@ -687,12 +786,12 @@ class FlotteApp(App):
             raise
 
         except Exception as e:
-            self.log.error(f"Failed to check git status: {e}")
+            self.log.error("Failed to check git status:", e)
             self.notify(f"Failed to check git status: {e}", severity="error")
 
     def _show_commit_dialog(self, wt: Worktree, changes: list[str]) -> None:
         """Show commit dialog for uncommitted changes."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Another operation started", severity="warning")
             return
 
@@ -709,7 +808,7 @@ class FlotteApp(App):
 
     def _on_commit_dialog_result(self, wt: Worktree, should_commit: bool) -> None:
         """Handle commit dialog result."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Another operation started", severity="warning")
             return
 
@@ -721,7 +820,7 @@ class FlotteApp(App):
     async def _do_commit_then_confirm(self, wt: Worktree) -> None:
         """Commit changes then show delete confirmation."""
         try:
-            if self._operation_in_progress:
+            if self._operation_busy():
                 self.log.debug("Operation started before commit, aborting")
                 return
 
@@ -733,12 +832,12 @@ class FlotteApp(App):
             raise
 
         except Exception as e:
-            self.log.error(f"Commit failed: {e}")
+            self.log.error("Commit failed:", e)
             self.notify(f"Commit failed: {e}", severity="error")
 
     def _show_delete_confirmation(self, wt: Worktree) -> None:
         """Show the delete worktree modal with progress."""
-        if self._operation_in_progress:
+        if self._operation_busy():
             self.notify("Another operation started", severity="warning")
             return
 
@@ -775,16 +874,14 @@ class FlotteApp(App):
             return
 
         # Remove from project model
-        self.project.worktrees.pop(deleted_name, None)
+        self.project.remove_worktree(deleted_name)
+        self._ride_wrappers.pop(deleted_name, None)
 
         self._sync_worktree_ui()
-        main_wt = next(
-            (w for w in self.project.worktrees.values() if w.is_main),
-            None
-        )
+        main_wt = self.project.main_worktree
         if main_wt:
             self.selected_worktree = main_wt
-            self.query_one("#worktree-header", WorktreeHeader).select_worktree(main_wt)
+            self._header.select_worktree(main_wt)
 
     def action_show_help(self) -> None:
         """Show help screen - '?' key."""
@@ -792,10 +889,6 @@ class FlotteApp(App):
 
     def action_ride(self) -> None:
         """Open workspace using configured ride_command."""
-        import subprocess
-        import shlex
-        import os
-
         if not self.selected_worktree:
             return
 
@@ -810,7 +903,7 @@ class FlotteApp(App):
         }
         try:
             subprocess.Popen(
-                shlex.split(self.current_config_project.ride_command),
+                _split_command(self.current_config_project.ride_command),
                 env=env,
                 start_new_session=True,
                 stdout=subprocess.DEVNULL,
@@ -838,5 +931,5 @@ class FlotteApp(App):
     def action_deselect(self) -> None:
         """Clear selection and unfocus - Escape key."""
         self.selected_worktree = None
-        self.query_one("#worktree-header", WorktreeHeader).clear()
-        self.query_one("#container-table", ContainerTable).worktree = None
+        self._header.clear()
+        self._table.worktree = None
@@ -1,6 +1,8 @@
+import os
+import stat
 import tomllib
 import logging
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -11,7 +13,7 @@ CONFIG_DIR = Path.home() / ".config" / "flotte"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     """A configured project with its settings."""
     name: str
@@ -21,7 +23,14 @@ class Project:
     ride_command: str = ""
 
 
-@dataclass
+# Project fields read from [[projects]] entries; those without a default are required
+_PROJECT_FIELDS = tuple(f.name for f in fields(Project))
+_REQUIRED_PROJECT_FIELDS = tuple(
+    f.name for f in fields(Project) if f.default is MISSING
+)
+
+
+@dataclass(slots=True)
 class Config:
     """Application configuration with sensible defaults."""
 
@@ -55,23 +64,20 @@ def load_config() -> Config:
             config.theme = data["theme"]
 
         # Load projects array
-        required_fields = ("name", "path", "worktree_path", "worktree_prefix")
         if "projects" in data and isinstance(data["projects"], list):
             for proj_data in data["projects"]:
                 if not isinstance(proj_data, dict):
                     logger.warning(f"Skipping invalid project entry: {proj_data}")
                     continue
-                missing = [f for f in required_fields if f not in proj_data]
+                missing = [f for f in _REQUIRED_PROJECT_FIELDS if f not in proj_data]
                 if missing:
                     logger.warning(f"Skipping project missing required fields {missing}: {proj_data}")
                     continue
-                config.projects.append(Project(
-                    name=str(proj_data["name"]),
-                    path=str(proj_data["path"]),
-                    worktree_path=str(proj_data["worktree_path"]),
-                    worktree_prefix=str(proj_data["worktree_prefix"]),
-                    ride_command=str(proj_data.get("ride_command", "")),
-                ))
+                config.projects.append(Project(**{
+                    name: str(proj_data[name])
+                    for name in _PROJECT_FIELDS
+                    if name in proj_data
+                }))
 
     except tomllib.TOMLDecodeError as e:
         logger.warning(f"Invalid config file: {e}")
@@ -81,6 +87,19 @@ def load_config() -> Config:
     return config
 
 
+# TOML basic-string escapes: short forms where TOML has them, \uXXXX for
+# the remaining control characters
+_TOML_ESCAPES = str.maketrans({
+    **{chr(c): f"\\u{c:04x}" for c in (*range(0x20), 0x7F)},
+    '"': '\\"', "\\": "\\\\", "\b": "\\b", "\t": "\\t", "\n": "\\n", "\f": "\\f", "\r": "\\r",
+})
+
+
+def _toml_string(value: str) -> str:
+    """Quote a value as a TOML basic string, escaping as needed."""
+    return '"' + value.translate(_TOML_ESCAPES) + '"'
+
+
 def save_config(config: Config) -> None:
     """Save configuration to file in TOML format."""
     ensure_config_dir()
@@ -89,20 +108,27 @@ def save_config(config: Config) -> None:
         "# Flotte Configuration",
         "",
         "# Color theme: onedark, onelight (or any .tcss file in styles/themes/)",
-        f'theme = "{config.theme}"',
+        f"theme = {_toml_string(config.theme)}",
         "",
     ]
 
     for project in config.projects:
-        lines.extend([
-            "[[projects]]",
-            f'name = "{project.name}"',
-            f'path = "{project.path}"',
-            f'worktree_path = "{project.worktree_path}"',
-            f'worktree_prefix = "{project.worktree_prefix}"',
-            f'ride_command = "{project.ride_command}"',
-            "",
-        ])
-
-    with open(CONFIG_FILE, "w") as f:
-        f.write("\n".join(lines))
+        lines.append("[[projects]]")
+        lines.extend(
+            f"{name} = {_toml_string(getattr(project, name))}"
+            for name in _PROJECT_FIELDS
+        )
+        lines.append("")
+
+    # Write to a temp file and rename over the config, so a crash
+    # mid-write never leaves a truncated config behind
+    tmp_file = CONFIG_FILE.with_suffix(".toml.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write("\n".join(lines).encode("utf-8"))
+        f.flush()
+        # The data must be on disk before the rename replaces the old file
+        os.fsync(f.fileno())
+    # Keep the existing file's permissions (e.g. a user-restricted 0600)
+    if CONFIG_FILE.exists():
+        os.chmod(tmp_file, stat.S_IMODE(CONFIG_FILE.stat().st_mode))
+    os.replace(tmp_file, CONFIG_FILE)
@@ -7,11 +7,11 @@ if TYPE_CHECKING:
     from .models.worktree import Worktree, WorktreeStatus
 
 
-class WorktreeStatusChanged(Message):
-    """Posted when a worktree's status changes during polling."""
+class WorktreesPolled(Message):
+    """Posted once per poll, listing the worktrees whose state changed."""
 
-    def __init__(self, worktree: Worktree):
-        self.worktree = worktree
+    def __init__(self, changed: list[Worktree]):
+        self.changed = changed  # Empty when the poll found nothing new
         super().__init__()
 
 
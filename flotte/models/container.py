@@ -1,5 +1,13 @@
+import re
+import sys
 from enum import Enum
 
+# Published host port (or port range) in a docker ps "Ports" column
+_HOST_PORT_RE = re.compile(r":(\d+(?:-\d+)?)->")
+
+# Service name fragments that identify a web server container
+_WEB_SERVERS = ("nginx", "apache", "caddy")
+
 
 class ContainerState(Enum):
     """Container states as reported by docker compose ps."""
@@ -15,10 +23,11 @@ class ContainerState(Enum):
     @classmethod
     def from_string(cls, value: str) -> "ContainerState":
         """Parse docker state string to enum, defaulting to UNKNOWN."""
-        try:
-            return cls(value.lower())
-        except ValueError:
-            return cls.UNKNOWN
+        return _STATES_BY_VALUE.get(value.lower(), cls.UNKNOWN)
+
+
+# Docker state string -> ContainerState
+_STATES_BY_VALUE: dict[str, ContainerState] = {state.value: state for state in ContainerState}
 
 
 class Container:
@@ -27,6 +36,18 @@ class Container:
     Persisted across polls, updated in place via update_from_docker().
     """
 
+    __slots__ = (
+        "service",
+        "is_web_server",
+        "id",
+        "name",
+        "image",
+        "state",
+        "status",
+        "ports",
+        "_ports_raw",
+    )
+
     def __init__(self, service: str):
         """Create container for a service.
 
@@ -34,12 +55,16 @@ class Container:
             service: Service name from docker-compose.yml
         """
         self.service = service
+        # The service name never changes, so classify it once
+        lowered = service.lower()
+        self.is_web_server = any(ws in lowered for ws in _WEB_SERVERS)
         self.id: str = ""
         self.name: str = ""
         self.image: str = ""
         self.state: ContainerState = ContainerState.UNKNOWN
         self.status: str = ""  # Human-readable (e.g., "Up 11 hours")
         self.ports: list[str] = []
+        self._ports_raw: str = ""  # Ports column the current ports were parsed from
 
     def update_from_docker(self, data: dict) -> None:
         """Update state from docker compose ps JSON output.
@@ -47,12 +72,25 @@ class Container:
         Args:
             data: Dict from docker compose ps --format json
         """
-        self.id = data.get("ID", "")[:12] if data.get("ID") else ""
-        self.name = data.get("Name", "")
-        self.image = data.get("Image", "")
+        # Values rarely change between polls: keep the existing (interned)
+        # strings when equal so later comparisons hit the identity fast path
+        container_id = data.get("ID", "")[:12] if data.get("ID") else ""
+        if container_id != self.id:
+            self.id = sys.intern(container_id)
+        name = data.get("Name", "")
+        if name != self.name:
+            self.name = sys.intern(name)
+        image = data.get("Image", "")
+        if image != self.image:
+            self.image = sys.intern(image)
         self.state = ContainerState.from_string(data.get("State", "unknown"))
-        self.status = data.get("Status", "")
-        self.ports = self._parse_ports(data.get("Ports", ""))
+        status = data.get("Status", "")
+        if status != self.status:
+            self.status = status
+        ports = data.get("Ports", "")
+        if ports != self._ports_raw:
+            self._ports_raw = ports
+            self.ports = self._parse_ports(ports)
 
     def mark_exited(self) -> None:
         """Mark container as exited (for services without containers)."""
@@ -62,6 +100,7 @@ class Container:
         self.state = ContainerState.EXITED
         self.status = "-"
         self.ports = []
+        self._ports_raw = ""
 
     @staticmethod
     def _parse_ports(ports_str: str) -> list[str]:
@@ -78,23 +117,20 @@ class Container:
         if not ports_str:
             return []
 
-        exposed_ports = set()
-        for port_spec in ports_str.split(","):
-            port_spec = port_spec.strip()
-            # Look for host:port->container pattern
-            # Examples: "0.0.0.0:3406->3306/tcp", "[::]:3406->3306/tcp"
-            if "->" in port_spec:
-                # Extract the host:port part before ->
-                host_part = port_spec.split("->")[0]
-                # Extract just the port number (after the last colon)
-                if ":" in host_part:
-                    host_port = host_part.rsplit(":", 1)[1]
-                    exposed_ports.add(host_port)
-
-        # Return sorted for consistent display
-        return sorted(exposed_ports, key=lambda p: int(p) if p.isdigit() else 0)
+        # Host port is what sits between the last colon and "->", e.g.
+        # "0.0.0.0:3406->3306/tcp", "[::]:3406->3306/tcp", ":::3406->3306/tcp"
+        exposed_ports = set(_HOST_PORT_RE.findall(ports_str))
+        if len(exposed_ports) < 2:
+            return list(exposed_ports)
+
+        # Return sorted for consistent display; ranges like "3000-3005"
+        # sort first
+        try:
+            return sorted(exposed_ports, key=int)
+        except ValueError:
+            return sorted(exposed_ports, key=lambda p: int(p) if p.isdigit() else 0)
 
     @property
     def is_healthy(self) -> bool:
         """Container is considered healthy if running."""
-        return self.state == ContainerState.RUNNING
+        return self.state is ContainerState.RUNNING
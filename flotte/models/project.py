@@ -4,7 +4,16 @@ import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .worktree import Worktree
+from ..messages import OperationCompleted, WorktreesPolled
+from .worktree import (
+    EVENTS_RETRY_DELAY,
+    POLL_BACKOFF,
+    POLL_DEBOUNCE,
+    POLL_INTERVAL_IDLE,
+    POLL_INTERVAL_NORMAL,
+    Worktree,
+    WorktreeStatus,
+)
 
 if TYPE_CHECKING:
     from textual.app import App
@@ -18,15 +27,42 @@ class Project:
     Also owns the polling loop for container status updates.
     """
 
+    __slots__ = (
+        "name",
+        "path",
+        "ride_command",
+        "worktrees",
+        "main_worktree",
+        "_worktree_list",
+        "_compose_projects",
+        "_app",
+        "_poll_task",
+        "_events_task",
+        "_poll_wakeup",
+        "_last_posted",
+        "_idle_interval",
+    )
+
     def __init__(self, name: str, path: str, ride_command: str = ""):
         self.name = name
         self.path = Path(path)
         self.ride_command = ride_command
         self.worktrees: dict[str, Worktree] = {}
+        self.main_worktree: Worktree | None = None
+        self._worktree_list: list[Worktree] | None = None
+        self._compose_projects: frozenset[str] | None = None
 
         # Polling state
         self._app: App | None = None
         self._poll_task: asyncio.Task | None = None
+        self._events_task: asyncio.Task | None = None
+        self._poll_wakeup = asyncio.Event()
+
+        # (status, poll_generation) per worktree as of the last posted poll
+        self._last_posted: dict[str, tuple[WorktreeStatus, int]] = {}
+
+        # Interval while idle; grows while polls find nothing new
+        self._idle_interval = POLL_INTERVAL_NORMAL
 
     def get_or_create_worktree(
         self,
@@ -48,68 +84,220 @@ class Project:
         Returns:
             Existing or newly created Worktree
         """
-        if name not in self.worktrees:
-            self.worktrees[name] = Worktree(
+        worktree = self.worktrees.get(name)
+        if worktree is None:
+            worktree = self.worktrees[name] = Worktree(
                 name=name,
                 path=path,
                 branch=branch,
                 compose_project_name=compose_project_name,
                 is_main=is_main,
             )
-        return self.worktrees[name]
+            if is_main:
+                self.main_worktree = worktree
+            self._worktree_list = None
+            self._compose_projects = None
+        return worktree
+
+    def set_worktrees(self, worktrees: list[Worktree]) -> None:
+        """Replace all worktrees (after discovery)."""
+        self.worktrees = {wt.name: wt for wt in worktrees}
+        self.main_worktree = next((wt for wt in worktrees if wt.is_main), None)
+        self._worktree_list = None
+        self._compose_projects = None
+        # The new objects must be reported by the next poll even when they
+        # reach the same (status, poll_generation) as the ones they replace
+        self._last_posted.clear()
+
+    def add_worktree(self, worktree: Worktree) -> None:
+        """Add (or replace) a single worktree."""
+        self.worktrees[worktree.name] = worktree
+        if worktree.is_main:
+            self.main_worktree = worktree
+        self._worktree_list = None
+        self._compose_projects = None
 
     def remove_worktree(self, name: str) -> None:
         """Remove worktree from project."""
-        self.worktrees.pop(name, None)
+        removed = self.worktrees.pop(name, None)
+        if removed is not None:
+            if removed is self.main_worktree:
+                self.main_worktree = None
+            self._worktree_list = None
+            self._compose_projects = None
+
+    def get_fresh(self, worktree: Worktree) -> Worktree | None:
+        """Get the project's current object for a worktree.
+
+        Rediscovery replaces Worktree objects, so a reference held elsewhere
+        (e.g. the UI selection) can go stale.
+
+        Args:
+            worktree: Possibly stale worktree
+
+        Returns:
+            The current worktree with the same name, or None if it was removed
+        """
+        return self.worktrees.get(worktree.name)
+
+    @property
+    def worktree_list(self) -> list[Worktree]:
+        """Worktrees in display order (main first, then by name).
+
+        Rebuilt only when worktrees are added or removed. Treat the returned
+        list as read-only; it is shared between callers.
+        """
+        if self._worktree_list is None:
+            self._worktree_list = sorted(
+                self.worktrees.values(), key=lambda w: (not w.is_main, w.name)
+            )
+        return self._worktree_list
+
+    @property
+    def compose_projects(self) -> frozenset[str]:
+        """Compose project names of all worktrees, for O(1) event matching."""
+        if self._compose_projects is None:
+            self._compose_projects = frozenset(
+                wt.compose_project_name for wt in self.worktrees.values()
+            )
+        return self._compose_projects
 
     def start_polling(self, app: App) -> None:
         """Start the polling loop for container status.
 
+        Also watches Docker events so container changes are polled right
+        away; the interval polls remain as a heartbeat.
+
         Args:
             app: The Textual app to post messages to.
         """
         self._app = app
 
-        if self._poll_task is not None:
-            self._poll_task.cancel()
-
+        self.stop_polling()
         self._poll_task = asyncio.create_task(self._poll_loop())
+        self._events_task = asyncio.create_task(self._watch_docker_events())
 
     def stop_polling(self) -> None:
         """Stop the polling loop."""
         if self._poll_task is not None:
             self._poll_task.cancel()
             self._poll_task = None
+        if self._events_task is not None:
+            self._events_task.cancel()
+            self._events_task = None
+
+    def request_poll(self) -> None:
+        """Wake the polling loop so it polls now instead of after its interval.
+
+        Call when an operation starts or finishes so the UI (and the poll
+        interval) reacts immediately.
+        """
+        self._poll_wakeup.set()
 
     async def _poll_loop(self) -> None:
         """Polling loop that runs until cancelled."""
-        from ..messages import WorktreeStatusChanged
-
         while True:
+            # Clear before polling so requests made during the poll trigger another
+            self._poll_wakeup.clear()
             try:
                 await self._poll()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 if self._app:
-                    self._app.log.error(f"Poll error: {e}")
+                    self._app.log.error("Poll error:", e)
 
-            # Use fastest interval needed by any worktree
+            # Use fastest interval needed by any worktree, unless woken earlier
             interval = self._get_poll_interval()
-            await asyncio.sleep(interval)
+            try:
+                await asyncio.wait_for(self._poll_wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                # Woken by a request: someone is active, so poll at the normal
+                # rate again. Let a burst of requests settle into one poll.
+                self._idle_interval = POLL_INTERVAL_NORMAL
+                await asyncio.sleep(POLL_DEBOUNCE)
+
+    async def _watch_docker_events(self) -> None:
+        """Request a poll whenever Docker reports a change to one of our projects."""
+        # Imported here: services imports models, so a module-level import
+        # would be circular
+        from ..services.docker_manager import DockerManager
+
+        while True:
+            try:
+                async for project_name in DockerManager.watch_projects():
+                    if project_name in self.compose_projects:
+                        self.request_poll()
+            except OSError as e:
+                # docker missing from PATH: polling alone keeps working
+                if self._app:
+                    self._app.log.error("Docker events unavailable:", e)
+
+            # Stream ended (e.g. daemon restarted): resubscribe after a pause
+            await asyncio.sleep(EVENTS_RETRY_DELAY)
 
     async def _poll(self) -> None:
         """Poll all worktrees and refresh UI."""
-        from ..messages import OperationCompleted, WorktreeStatusChanged
+        # Imported here: services imports models, so a module-level import
+        # would be circular
+        from ..services.docker_manager import DockerManager
+
+        # Nothing to poll (no worktrees discovered yet)
+        worktree_list = self.worktree_list
+        if not worktree_list:
+            return
+
+        # One docker ps for every worktree, plus each worktree's service list.
+        # A failing service lookup (e.g. a worktree directory removed mid-poll)
+        # must not abort the poll for the other worktrees.
+        containers_by_project, services_list = await asyncio.gather(
+            DockerManager.get_containers_bulk(
+                [wt.compose_project_name for wt in worktree_list]
+            ),
+            asyncio.gather(
+                *[wt.docker_manager.get_services() for wt in worktree_list],
+                return_exceptions=True,
+            ),
+        )
+
+        # Apply results, collecting cleared transient statuses
+        cleared_statuses: list[WorktreeStatus | None] = []
+        for wt, services in zip(worktree_list, services_list):
+            if isinstance(services, BaseException):
+                if self._app:
+                    self._app.log.error("Poll error for", wt.name, services)
+                cleared_statuses.append(None)
+                continue
+            cleared_statuses.append(
+                wt.apply_poll(containers_by_project[wt.compose_project_name], services)
+            )
+
+        # Collect worktrees whose status or Docker data moved since last poll
+        last_posted = self._last_posted
+        self._last_posted = {
+            wt.name: (wt.status, wt.poll_generation) for wt in worktree_list
+        }
+        if last_posted.keys() != self._last_posted.keys():
+            changed = worktree_list  # Worktrees were added or removed
+        else:
+            changed = [
+                wt for wt in worktree_list
+                if last_posted[wt.name] != self._last_posted[wt.name]
+            ]
 
-        # Poll all worktrees in parallel, collecting cleared transient statuses
-        worktree_list = list(self.worktrees.values())
-        cleared_statuses = await asyncio.gather(*[wt.poll() for wt in worktree_list])
+        # Back off while nothing changes; any change restores the normal rate
+        if changed:
+            self._idle_interval = POLL_INTERVAL_NORMAL
+        else:
+            self._idle_interval = min(
+                self._idle_interval * POLL_BACKOFF, POLL_INTERVAL_IDLE
+            )
 
-        # Always refresh UI with current state
+        # One message per poll (the app refreshes git status on each)
         if self._app:
-            for wt in worktree_list:
-                self._app.post_message(WorktreeStatusChanged(wt))
+            self._app.post_message(WorktreesPolled(changed))
 
             # Post OperationCompleted for any worktrees that reached their target
             for wt, cleared in zip(worktree_list, cleared_statuses):
@@ -117,13 +305,14 @@ class Project:
                     self._app.post_message(OperationCompleted(wt, cleared))
 
     def _get_poll_interval(self) -> float:
-        """Get poll interval - fast if any worktree is transient."""
-        from .worktree import POLL_INTERVAL_NORMAL
+        """Get poll interval - fast if any worktree is transient.
 
+        Otherwise the interval stretches from POLL_INTERVAL_NORMAL up to
+        POLL_INTERVAL_IDLE while consecutive polls find no changes.
+        """
         if not self.worktrees:
             return POLL_INTERVAL_NORMAL
-        return min(wt.poll_interval for wt in self.worktrees.values())
-
-    async def poll_once(self) -> None:
-        """Poll once immediately (for initial load)."""
-        await self._poll()
+        interval = min(wt.poll_interval for wt in self.worktrees.values())
+        if interval < POLL_INTERVAL_NORMAL:
+            return interval
+        return self._idle_interval
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .container import Container, ContainerState
 
+if TYPE_CHECKING:
+    from ..services.docker_manager import DockerManager
+
 # Polling intervals
 POLL_INTERVAL_NORMAL = 5.0  # seconds
 POLL_INTERVAL_FAST = 1.0  # seconds during transient operations
+POLL_INTERVAL_IDLE = 10.0  # seconds, longest interval while nothing changes
+POLL_BACKOFF = 1.5  # interval growth factor per poll that found no changes
+POLL_DEBOUNCE = 0.2  # seconds to coalesce bursts of poll requests
+EVENTS_RETRY_DELAY = 10.0  # seconds before resubscribing to Docker events
+
+# Sort key for container_list
+_by_service = attrgetter("service")
+
+# Marker for a memo that has not been computed yet
+_UNSET = object()
 
 
 class WorktreeStatus(Enum):
@@ -30,6 +45,23 @@ class Worktree:
     operation states for flash-free status display.
     """
 
+    __slots__ = (
+        "name",
+        "path",
+        "branch",
+        "compose_project_name",
+        "is_main",
+        "containers",
+        "_transient",
+        "_target",
+        "_actual_status",
+        "_container_list",
+        "_web_url",
+        "_last_poll",
+        "_docker_manager",
+        "poll_generation",
+    )
+
     def __init__(
         self,
         name: str,
@@ -60,6 +92,24 @@ class Worktree:
         self._transient: WorktreeStatus | None = None
         self._target: WorktreeStatus | None = None
 
+        # actual_status memo, reset whenever containers change
+        self._actual_status: WorktreeStatus | None = None
+
+        # container_list memo, reset when services are added or removed
+        self._container_list: list[Container] | None = None
+
+        # web_url memo (_UNSET until computed), reset when containers change
+        self._web_url: str | None | object = _UNSET
+
+        # Docker data applied by the last apply_poll, to skip identical polls
+        self._last_poll: tuple[list[dict], list[str]] | None = None
+
+        # DockerManager for this worktree, created on first use
+        self._docker_manager = None
+
+        # Bumped whenever apply_poll applies new Docker data
+        self.poll_generation = 0
+
     def get_or_create_container(self, service: str) -> Container:
         """Get existing container or create new one.
 
@@ -69,34 +119,39 @@ class Worktree:
         Returns:
             Existing or newly created Container
         """
-        if service not in self.containers:
-            self.containers[service] = Container(service)
-        return self.containers[service]
+        container = self.containers.get(service)
+        if container is None:
+            container = self.containers[service] = Container(service)
+            self._actual_status = None
+            self._container_list = None
+            self._web_url = _UNSET
+        return container
 
     @property
     def actual_status(self) -> WorktreeStatus:
+        """Status computed from container states (memoized between polls)."""
+        if self._actual_status is None:
+            self._actual_status = self._compute_actual_status()
+        return self._actual_status
+
+    def _compute_actual_status(self) -> WorktreeStatus:
         """Compute status from container states."""
         if not self.containers:
             return WorktreeStatus.STOPPED
 
-        containers = list(self.containers.values())
-        running = sum(1 for c in containers if c.state == ContainerState.RUNNING)
-        starting = sum(
-            1 for c in containers
-            if c.state in (ContainerState.CREATED, ContainerState.RESTARTING)
-        )
-
-        if running == len(self.containers):
-            return WorktreeStatus.RUNNING
-        elif starting > 0:
-            # Some containers are still starting up
-            return WorktreeStatus.STARTING
-        elif running > 0:
-            # Some running (others may be exited) - normal running state
-            # Some containers like 'assets' are meant to exit after completing
-            return WorktreeStatus.RUNNING
-        else:
-            return WorktreeStatus.STOPPED
+        running = False
+        for container in self.containers.values():
+            state = container.state
+            if state is ContainerState.RUNNING:
+                running = True
+            elif state is ContainerState.CREATED or state is ContainerState.RESTARTING:
+                # Not everything is running and some containers are still
+                # starting up; nothing later in the loop can change that
+                return WorktreeStatus.STARTING
+
+        # Fully running, or some running with others exited - normal
+        # running state (containers like 'assets' exit after completing)
+        return WorktreeStatus.RUNNING if running else WorktreeStatus.STOPPED
 
     @property
     def status(self) -> WorktreeStatus:
@@ -138,17 +193,36 @@ class Worktree:
         self._target = None
         return cleared
 
-    async def poll(self) -> WorktreeStatus | None:
-        """Poll container status from Docker.
+    @property
+    def docker_manager(self) -> DockerManager:
+        """DockerManager bound to this worktree, reused across polls."""
+        if self._docker_manager is None:
+            from ..services.docker_manager import DockerManager
+
+            self._docker_manager = DockerManager(
+                self.path, self.compose_project_name
+            )
+        return self._docker_manager
+
+    def apply_poll(
+        self, container_data: list[dict], all_services: list[str]
+    ) -> WorktreeStatus | None:
+        """Update containers from already-fetched Docker data.
+
+        Args:
+            container_data: Dicts shaped like docker compose ps --format json
+            all_services: All service names from docker compose config
 
         Returns:
             The transient status that was cleared if target was reached,
             or None if no transient was auto-cleared.
         """
-        from ..services.docker_manager import DockerManager
-
-        docker_mgr = DockerManager(self.path, self.compose_project_name)
-        container_data, all_services = await docker_mgr.get_container_data()
+        # Steady state: Docker reported exactly what it did last poll
+        poll_data = (container_data, all_services)
+        if poll_data == self._last_poll:
+            return self._check_target()
+        self._last_poll = poll_data
+        self.poll_generation += 1
 
         # Update containers from poll data
         seen_services: set[str] = set()
@@ -161,9 +235,11 @@ class Worktree:
                 seen_services.add(service)
 
         # Remove containers for services no longer present
-        for service in list(self.containers.keys()):
-            if service not in seen_services:
+        stale_services = self.containers.keys() - seen_services
+        if stale_services:
+            for service in stale_services:
                 del self.containers[service]
+            self._container_list = None
 
         # Add placeholders for services without containers
         for service in all_services:
@@ -171,23 +247,40 @@ class Worktree:
                 container = self.get_or_create_container(service)
                 container.mark_exited()
 
-        # Auto-clear transient if target status reached
-        if self._target is not None and self.actual_status == self._target:
+        # Container states changed: recompute status and URL on next read
+        self._actual_status = None
+        self._web_url = _UNSET
+
+        return self._check_target()
+
+    def _check_target(self) -> WorktreeStatus | None:
+        """Auto-clear the transient status if its target status was reached."""
+        if self._target is not None and self.actual_status is self._target:
             return self.clear_operation()
         return None
 
     @property
     def web_url(self) -> str | None:
-        """Get URL for web server container if present."""
-        WEB_SERVERS = ("nginx", "apache", "caddy")
+        """Get URL for web server container if present (memoized between polls)."""
+        if self._web_url is _UNSET:
+            self._web_url = self._compute_web_url()
+        return self._web_url
+
+    def _compute_web_url(self) -> str | None:
+        """Find the first web server container with a published port."""
         for container in self.containers.values():
-            if any(ws in container.service.lower() for ws in WEB_SERVERS):
-                if container.ports:
-                    return f"http://localhost:{container.ports[0]}"
+            if container.is_web_server and container.ports:
+                return f"http://localhost:{container.ports[0]}"
         return None
 
     # Backwards compatibility: expose containers as list for widgets
     @property
     def container_list(self) -> list[Container]:
-        """Get containers as sorted list (for table display)."""
-        return sorted(self.containers.values(), key=lambda c: c.service)
+        """Get containers as sorted list (for table display).
+
+        Treat the returned list as read-only; it is reused until the set of
+        services changes.
+        """
+        if self._container_list is None:
+            self._container_list = sorted(self.containers.values(), key=_by_service)
+        return self._container_list
@@ -10,8 +10,23 @@ from textual.app import ComposeResult
 from ..services import WorktreeManager
 from ..models import Worktree
 
+# Progress messages are written at most once per this many seconds
+STATUS_UPDATE_INTERVAL = 0.05
 
-@dataclass
+# Allow alphanumeric, dash, underscore, slash
+_BRANCH_RE = re.compile(r"[a-zA-Z0-9/_-]+")
+
+# Common branches listed first, in this order
+_BRANCH_PRIORITY = {"beta": 0, "master": 1, "main": 2, "develop": 3}
+
+
+def _branch_sort_key(branch: str) -> tuple[int, int | str]:
+    if branch in _BRANCH_PRIORITY:
+        return (0, _BRANCH_PRIORITY[branch])
+    return (1, branch.lower())
+
+
+@dataclass(frozen=True, slots=True)
 class CreateWorktreeParams:
     """Parameters for creating a new worktree."""
     branch_name: str
@@ -19,7 +34,7 @@ class CreateWorktreeParams:
     clone_data: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateWorktreeResult:
     """Result of worktree creation."""
     worktree: Worktree
@@ -37,7 +52,8 @@ class CreateWorktreeScreen(ModalScreen[CreateWorktreeResult | None]):
         super().__init__()
         self.worktree_manager = worktree_manager
         self._all_branches: list[str] = []
-        self._existing_worktree_branches: set[str] = set()
+        self._existing_worktree_branches: frozenset[str] = frozenset()
+        self._pending_status: str | None = None
         self._is_new_branch_mode: bool = True
 
     def compose(self) -> ComposeResult:
@@ -74,37 +90,14 @@ class CreateWorktreeScreen(ModalScreen[CreateWorktreeResult | None]):
 
     async def _load_branches(self) -> None:
         """Fetch local git branches and populate both select widgets."""
-        import asyncio
-
-        proc = await asyncio.create_subprocess_exec(
-            "git", "branch", "--format=%(refname:short)",
-            cwd=self.worktree_manager.main_repo_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        branches = sorted(
+            await self.worktree_manager.get_cached_branches(),
+            key=_branch_sort_key,
         )
-        stdout, _ = await proc.communicate()
-
-        branches = []
-        for line in stdout.decode().strip().split("\n"):
-            branch = line.strip()
-            if branch:
-                branches.append(branch)
-
-        # Sort with common branches first
-        priority = ["beta", "master", "main", "develop"]
-        def sort_key(b):
-            try:
-                return (0, priority.index(b))
-            except ValueError:
-                return (1, b.lower())
-
-        branches.sort(key=sort_key)
         self._all_branches = branches
 
         # Get branches that already have worktrees
-        self._existing_worktree_branches = {
-            wt.branch for wt in self.worktree_manager.worktrees.values()
-        }
+        self._existing_worktree_branches = self.worktree_manager.branch_set
 
         # Populate base-branch select (all branches for new branch mode)
         base_select = self.query_one("#base-branch", Select)
@@ -130,10 +123,8 @@ class CreateWorktreeScreen(ModalScreen[CreateWorktreeResult | None]):
         self._is_new_branch_mode = event.pane.id == "tab-new"
 
     def _validate_branch_name(self, value: str) -> bool:
-        if not value or not value.strip():
-            return False
-        # Allow alphanumeric, dash, underscore, slash
-        return bool(re.match(r'^[a-zA-Z0-9/_-]+$', value))
+        # Empty and whitespace-only names never match
+        return _BRANCH_RE.fullmatch(value) is not None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         event.stop()  # Prevent bubbling to app
@@ -204,8 +195,16 @@ class CreateWorktreeScreen(ModalScreen[CreateWorktreeResult | None]):
         self.refresh(layout=True)
 
     def _update_status(self, message: str) -> None:
-        """Update status message."""
-        self.query_one("#status-text", Static).update(message)
+        """Update status message (throttled; the latest message wins)."""
+        if self._pending_status is None:
+            self.set_timer(STATUS_UPDATE_INTERVAL, self._flush_status)
+        self._pending_status = message
+
+    def _flush_status(self) -> None:
+        """Write the most recent pending status message."""
+        if self._pending_status is not None:
+            self.query_one("#status-text", Static).update(self._pending_status)
+            self._pending_status = None
 
     async def _do_create(self, params: CreateWorktreeParams) -> None:
         """Perform the actual worktree creation."""
@@ -220,29 +219,25 @@ class CreateWorktreeScreen(ModalScreen[CreateWorktreeResult | None]):
             # Clone volumes if requested
             if params.clone_data:
                 self._update_status("Cloning data volumes...")
-                main_env = self.worktree_manager._parse_env(
-                    self.worktree_manager.main_repo_path
+                main_env = await asyncio.to_thread(
+                    self.worktree_manager._parse_env,
+                    self.worktree_manager.main_repo_path,
                 )
                 source_project = main_env.get(
                     "COMPOSE_PROJECT_NAME", self.worktree_manager.project_name
                 )
-                volumes = await self.worktree_manager.get_volumes()
-                for i, vol in enumerate(volumes):
-                    self._update_status(f"Cloning volume {i+1}/{len(volumes)}: {vol}...")
-                    source_vol = f"{source_project}_{vol}"
-                    target_vol = f"{worktree.compose_project_name}_{vol}"
-                    # Use asyncio.to_thread to release event loop for UI updates
-                    await asyncio.to_thread(
-                        self.worktree_manager._run_command,
-                        "docker", "volume", "create", target_vol
-                    )
-                    await asyncio.to_thread(
-                        self.worktree_manager._run_command,
-                        "docker", "run", "--rm",
-                        "-v", f"{source_vol}:/source:ro",
-                        "-v", f"{target_vol}:/dest",
-                        "alpine", "sh", "-c", "cp -a /source/. /dest/",
-                        timeout=300.0,
+                # One container copies every volume at once
+                failed_volumes = await self.worktree_manager.clone_volumes(
+                    source_project,
+                    worktree.compose_project_name,
+                    on_progress=lambda vol, done, total: self._update_status(
+                        f"Cloned volume {done}/{total}: {vol}"
+                    ),
+                )
+                if failed_volumes:
+                    self.notify(
+                        f"Failed to clone volumes: {', '.join(failed_volumes)}",
+                        severity="warning",
                     )
 
                 # Clone gitignored bind mounts
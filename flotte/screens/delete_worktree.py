@@ -1,4 +1,3 @@
-import asyncio
 from dataclasses import dataclass
 
 from textual.screen import ModalScreen
@@ -10,7 +9,7 @@ from ..services import WorktreeManager
 from ..models import Worktree
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeleteWorktreeResult:
     """Result of worktree deletion."""
     success: bool
@@ -55,7 +54,13 @@ class DeleteWorktreeScreen(ModalScreen[DeleteWorktreeResult | None]):
                 yield Button("Delete", id="delete-btn", variant="error")
 
     def on_mount(self) -> None:
-        self.query_one("#status-area").display = False
+        # Cache widgets toggled or updated during deletion
+        self._confirm_content = self.query_one("#confirm-content")
+        self._dialog_buttons = self.query_one("#dialog-buttons")
+        self._status_area = self.query_one("#status-area")
+        self._status_text = self.query_one("#status-text", Static)
+
+        self._status_area.display = False
         self.query_one("#delete-btn", Button).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -79,31 +84,25 @@ class DeleteWorktreeScreen(ModalScreen[DeleteWorktreeResult | None]):
 
     def _show_deleting_status(self) -> None:
         """Show deleting status and disable controls."""
-        self.query_one("#confirm-content").display = False
-        self.query_one("#dialog-buttons").display = False
-        self.query_one("#status-area").display = True
-        self.refresh(layout=True)
+        # Changing display already schedules the relayout
+        self._confirm_content.display = False
+        self._dialog_buttons.display = False
+        self._status_area.display = True
 
     def _update_status(self, message: str) -> None:
         """Update status message."""
-        self.query_one("#status-text", Static).update(message)
+        self._status_text.update(message)
 
     async def _do_delete(self) -> None:
         """Perform the actual worktree deletion."""
         try:
             # Stop containers and remove volumes
             self._update_status("Stopping containers...")
-            await asyncio.to_thread(
-                self.worktree_manager.cleanup_docker_sync,
-                self.worktree
-            )
+            await self.worktree_manager.cleanup_docker(self.worktree)
 
             # Remove worktree directory
             self._update_status("Removing worktree...")
-            await asyncio.to_thread(
-                self.worktree_manager.remove_worktree_sync,
-                self.worktree
-            )
+            await self.worktree_manager.remove_worktree(self.worktree)
 
             # Success
             self.dismiss(DeleteWorktreeResult(
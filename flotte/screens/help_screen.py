@@ -1,5 +1,5 @@
 from textual.screen import ModalScreen
-from textual.containers import Vertical, Horizontal
+from textual.containers import Vertical
 from textual.widgets import Static
 from textual.app import ComposeResult
 
@@ -13,6 +13,22 @@ class HelpScreen(ModalScreen):
         ("escape", "dismiss", "Close"),
     ]
 
+    # (section title, ((key, description), ...))
+    SECTIONS = (
+        ("ACTIONS", (
+            ("n", "Create worktree"),
+            ("d", "Delete worktree"),
+            ("s", "Start services"),
+            ("x", "Stop services"),
+            ("r", "Refresh status"),
+            ("R", "Go Ride"),
+        )),
+        ("GENERAL", (
+            ("q", "Quit"),
+            ("?", "Show help"),
+        )),
+    )
+
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("Flotte", id="help-header")
@@ -22,33 +38,21 @@ class HelpScreen(ModalScreen):
             yield Static("Keyboard Shortcuts", id="dialog-title")
             yield Static("", id="title-separator")
 
-            yield Static("ACTIONS", classes="section-title")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("n", classes="shortcut-key")
-                yield Static("Create worktree", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("d", classes="shortcut-key")
-                yield Static("Delete worktree", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("s", classes="shortcut-key")
-                yield Static("Start services", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("x", classes="shortcut-key")
-                yield Static("Stop services", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("r", classes="shortcut-key")
-                yield Static("Refresh status", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("R", classes="shortcut-key")
-                yield Static("Go Ride", classes="shortcut-desc")
-
-            yield Static("GENERAL", classes="section-title-spaced")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("q", classes="shortcut-key")
-                yield Static("Quit", classes="shortcut-desc")
-            with Horizontal(classes="shortcut-row"):
-                yield Static("?", classes="shortcut-key")
-                yield Static("Show help", classes="shortcut-desc")
+            # One Static per section: the rows are plain text, so they don't
+            # need a widget each
+            green = self.app.theme_colors.green
+            for i, (title, shortcuts) in enumerate(self.SECTIONS):
+                yield Static(
+                    title,
+                    classes="section-title-spaced" if i else "section-title",
+                )
+                yield Static(
+                    "\n".join(
+                        f"[{green}]{key:<4}[/{green}]{desc}"
+                        for key, desc in shortcuts
+                    ),
+                    classes="shortcut-list",
+                )
 
             yield Static(f"v{__version__}", id="help-footer")
 
@@ -1,6 +1,39 @@
 import asyncio
 import json
+import time
 from pathlib import Path
+from typing import AsyncIterator
+
+try:
+    # Optional speedup: parses bytes directly, several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Label docker compose sets on every container it manages
+PROJECT_LABEL = "com.docker.compose.project"
+
+# docker ps row rendered with the same keys as docker compose ps --format json
+PS_FORMAT = (
+    '{"ID":{{json .ID}},"Name":{{json .Names}},"Image":{{json .Image}},'
+    '"State":{{json .State}},"Status":{{json .Status}},"Ports":{{json .Ports}},'
+    '"Project":{{json (.Label "com.docker.compose.project")}},'
+    '"Service":{{json (.Label "com.docker.compose.service")}}}'
+)
+
+# Service names per compose file: ((mtime_ns, size) of each input file or
+# None if missing, monotonic time cached, services)
+_services_cache: dict[Path, tuple[tuple, float, list[str]]] = {}
+
+# Cached service lists are re-read after this long even when the compose
+# file and .env are unchanged, to pick up include:/extends: targets
+SERVICES_CACHE_TTL = 30.0  # seconds
+
+# Container lifecycle events that can change what a poll reports
+WATCHED_EVENTS = ("create", "start", "restart", "die", "pause", "unpause", "destroy")
+
+# StreamReader buffer size; the 64 KiB default is small for big ps listings
+STREAM_LIMIT = 1 << 20
 
 
 class DockerManager:
@@ -17,6 +50,9 @@ class DockerManager:
         self.worktree_path = worktree_path
         self.project_name = project_name
         self.compose_file = worktree_path / "docker-compose.yml"
+        # Files compose resolves the service list from (-f disables the
+        # override file lookup); include:/extends: targets are left to the TTL
+        self._compose_inputs = (self.compose_file, worktree_path / ".env")
 
     def _compose_args(self) -> list[str]:
         """Base arguments for all docker compose commands."""
@@ -30,15 +66,45 @@ class DockerManager:
         ]
 
     async def _run_compose(
-        self, *args: str, timeout: float = 60.0
+        self, *args: str, timeout: float = 60.0, capture_stderr: bool = True
     ) -> tuple[int, str, str]:
         """Execute a docker compose command."""
         cmd = self._compose_args() + list(args)
-        proc = await asyncio.create_subprocess_exec(
+        return await self._run_docker(
             *cmd,
             cwd=self.worktree_path,
+            timeout=timeout,
+            capture_stderr=capture_stderr,
+        )
+
+    @staticmethod
+    async def _run_docker(
+        *cmd: str,
+        cwd: Path | None = None,
+        timeout: float = 60.0,
+        capture_stderr: bool = True,
+    ) -> tuple[int, str, str]:
+        """Execute a docker command.
+
+        Args:
+            *cmd: Command and arguments to execute
+            cwd: Working directory for the command
+            timeout: Seconds to wait before killing the command
+            capture_stderr: If False, stderr is discarded and returned empty
+
+        Returns:
+            (returncode, stdout, stderr)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=(
+                asyncio.subprocess.PIPE
+                if capture_stderr
+                else asyncio.subprocess.DEVNULL
+            ),
+            limit=STREAM_LIMIT,
         )
         try:
             stdout, stderr = await asyncio.wait_for(
@@ -47,51 +113,177 @@ class DockerManager:
             return (
                 proc.returncode or 0,
                 stdout.decode("utf-8", errors="replace"),
-                stderr.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace") if stderr else "",
             )
         except asyncio.TimeoutError:
             proc.kill()
+            await proc.wait()
             return (-1, "", "Command timed out")
 
-    async def get_container_data(self) -> tuple[list[dict], list[str]]:
-        """Get raw container data and all service names.
+    @staticmethod
+    async def _stream_json_lines(
+        *cmd: str, cwd: Path | None = None, timeout: float = 60.0
+    ) -> AsyncIterator[dict]:
+        """Execute a docker command and parse its NDJSON output as it arrives.
 
-        Returns:
-            Tuple of:
-            - List of dicts from docker compose ps (container data)
-            - List of all service names from docker compose config
-        """
-        container_data: list[dict] = []
-        all_services: list[str] = []
+        Each non-empty stdout line is decoded straight from bytes, so the
+        output is never joined into one string. Lines that are not valid
+        JSON are skipped. Output stops early if the command times out.
 
-        # Get existing containers (running or stopped)
-        returncode, stdout, stderr = await self._run_compose(
-            "ps", "-a", "--format", "json"
-        )
+        Args:
+            *cmd: Command and arguments to execute
+            cwd: Working directory for the command
+            timeout: Seconds allowed for the whole command
 
-        if returncode == 0 and stdout.strip():
-            # docker compose ps --format json outputs ONE JSON OBJECT PER LINE
-            for line in stdout.strip().split("\n"):
+        Yields:
+            One dict per JSON line
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STREAM_LIMIT,
+        )
+        try:
+            assert proc.stdout is not None
+            while line := await asyncio.wait_for(
+                proc.stdout.readline(), deadline - loop.time()
+            ):
                 if not line.strip():
                     continue
                 try:
-                    data = json.loads(line)
-                    container_data.append(data)
+                    # orjson's decode error subclasses json.JSONDecodeError
+                    yield _json_loads(line)
                 except json.JSONDecodeError:
                     continue
+            await asyncio.wait_for(proc.wait(), deadline - loop.time())
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    @staticmethod
+    async def watch_projects() -> AsyncIterator[str]:
+        """Yield the compose project name of each container lifecycle event.
+
+        Runs one long-lived `docker events` process covering every compose
+        project. The stream ends if the process exits (e.g. the daemon
+        stops); the process is killed when the caller stops iterating.
+
+        Yields:
+            Compose project name of the container the event is about
+        """
+        filters = ["--filter", "type=container", "--filter", f"label={PROJECT_LABEL}"]
+        for event in WATCHED_EVENTS:
+            filters += ["--filter", f"event={event}"]
+
+        proc = await asyncio.create_subprocess_exec(
+            "docker", "events", *filters,
+            "--format", f'{{{{index .Actor.Attributes "{PROJECT_LABEL}"}}}}',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=STREAM_LIMIT,
+        )
+        try:
+            assert proc.stdout is not None
+            async for line in proc.stdout:
+                project = line.decode("utf-8", errors="replace").strip()
+                if project:
+                    yield project
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    @classmethod
+    async def get_containers_bulk(
+        cls, project_names: list[str]
+    ) -> dict[str, list[dict]]:
+        """Get container data for several compose projects in one docker call.
+
+        Lists all compose-managed containers with a single `docker ps` and
+        buckets them by their compose project label.
+
+        Args:
+            project_names: Docker Compose project names to collect
+
+        Returns:
+            Dict of project name -> list of dicts shaped like
+            docker compose ps --format json output
+        """
+        by_project: dict[str, list[dict]] = {name: [] for name in project_names}
+        if not by_project:
+            return by_project
+
+        async for data in cls._stream_json_lines(
+            "docker", "ps", "-a",
+            "--filter", f"label={PROJECT_LABEL}",
+            "--format", PS_FORMAT,
+        ):
+            containers = by_project.get(data.get("Project", ""))
+            if containers is not None:
+                containers.append(data)
+
+        return by_project
+
+    @staticmethod
+    def clear_services_cache() -> None:
+        """Forget all cached service lists (e.g. on a manual refresh)."""
+        _services_cache.clear()
+
+    def _input_stats(self) -> tuple:
+        """(mtime_ns, size) of each compose input file, None if missing."""
+        stats = []
+        for path in self._compose_inputs:
+            try:
+                st = path.stat()
+            except OSError:
+                stats.append(None)
+            else:
+                stats.append((st.st_mtime_ns, st.st_size))
+        return tuple(stats)
+
+    async def get_services(self) -> list[str]:
+        """Get all service names defined in docker-compose.yml.
+
+        The list is cached per compose file and reused for up to
+        SERVICES_CACHE_TTL seconds while neither the compose file nor .env
+        changes, so most polls skip the compose config call. Treat the
+        returned list as read-only.
+        """
+        stats = self._input_stats()
+        cached = _services_cache.get(self.compose_file)
+        if (
+            cached is not None
+            and cached[0] == stats
+            and time.monotonic() - cached[1] < SERVICES_CACHE_TTL
+        ):
+            return cached[2]
+
+        all_services: list[str] = []
 
-        # Get all defined services
         returncode, stdout, stderr = await self._run_compose(
             "config", "--services"
         )
 
         if returncode == 0 and stdout.strip():
-            for service_name in stdout.strip().split("\n"):
+            for service_name in stdout.splitlines():
                 service_name = service_name.strip()
                 if service_name:
                     all_services.append(service_name)
 
-        return container_data, all_services
+            # A missing compose file is left for docker compose to report
+            if stats[0] is not None:
+                _services_cache[self.compose_file] = (
+                    stats, time.monotonic(), all_services
+                )
+
+        return all_services
 
     async def start_service(self, service: str) -> bool:
         """
@@ -100,7 +292,9 @@ class DockerManager:
         Returns:
             True if successful, False otherwise
         """
-        returncode, _, _ = await self._run_compose("up", "-d", service)
+        returncode, _, _ = await self._run_compose(
+            "up", "-d", service, capture_stderr=False
+        )
         return returncode == 0
 
     async def stop_service(self, service: str) -> bool:
@@ -110,7 +304,9 @@ class DockerManager:
         Returns:
             True if successful, False otherwise
         """
-        returncode, _, _ = await self._run_compose("stop", service)
+        returncode, _, _ = await self._run_compose(
+            "stop", service, capture_stderr=False
+        )
         return returncode == 0
 
     async def restart_service(self, service: str) -> bool:
@@ -120,5 +316,7 @@ class DockerManager:
         Returns:
             True if successful, False otherwise
         """
-        returncode, _, _ = await self._run_compose("restart", service)
+        returncode, _, _ = await self._run_compose(
+            "restart", service, capture_stderr=False
+        )
         return returncode == 0
@@ -1,5 +1,4 @@
 import asyncio
-import os
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -10,21 +9,23 @@ class RideWrapper:
     def __init__(self, worktree_path: Path, project_name: str | None = None):
         self.worktree_path = worktree_path
         self.project_name = project_name
+        # Both are fixed for the wrapper's lifetime, so build the prefix once
+        self._base = ("docker", "compose") + (
+            ("-p", project_name) if project_name else ()
+        )
 
     def _base_cmd(self) -> list[str]:
         """Get base docker compose command with project name."""
-        cmd = ["docker", "compose"]
-        if self.project_name:
-            cmd.extend(["-p", self.project_name])
-        return cmd
+        return list(self._base)
 
     async def _run(self, *args: str, timeout: float = 300.0) -> tuple[int, str, str]:
         """Execute a docker compose command."""
-        cmd = self._base_cmd() + list(args)
+        # The environment is inherited; passing env=os.environ would make
+        # every spawn re-encode the whole environment block
         proc = await asyncio.create_subprocess_exec(
-            *cmd,
+            *self._base,
+            *args,
             cwd=self.worktree_path,
-            env=os.environ,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -37,19 +38,30 @@ class RideWrapper:
             )
         except asyncio.TimeoutError:
             proc.kill()
+            await proc.wait()  # Reap it so no zombie is left behind
             return (-1, "", "Command timed out")
 
     async def start(self) -> tuple[int, str, str]:
         """Start Docker containers."""
         return await self._run("up", "-d")
 
-    async def stop(self) -> tuple[int, str, str]:
-        """Stop Docker containers."""
+    async def down(self) -> tuple[int, str, str]:
+        """Stop and remove Docker containers and networks."""
         return await self._run("down")
 
+    async def stop(self) -> tuple[int, str, str]:
+        """Stop Docker containers, keeping containers and networks in place."""
+        return await self._run("stop")
+
     async def restart(self) -> tuple[int, str, str]:
-        """Restart Docker containers."""
-        await self.stop()
+        """Restart Docker containers.
+
+        Uses compose stop rather than down so the project network is not torn
+        down and recreated; up -d still recreates containers whose config changed.
+        """
+        returncode, stdout, stderr = await self.stop()
+        if returncode != 0:
+            return returncode, stdout, stderr
         return await self.start()
 
     async def status(self) -> tuple[int, str, str]:
@@ -65,7 +77,6 @@ class RideWrapper:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=self.worktree_path,
-            env=os.environ,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
         )
@@ -74,11 +85,8 @@ class RideWrapper:
             assert proc.stdout is not None
             async for line in proc.stdout:
                 yield line.decode("utf-8", errors="replace").rstrip("\n")
-        except asyncio.CancelledError:
-            proc.terminate()
-            await proc.wait()
-            raise
         finally:
+            # Covers cancellation, the caller closing the generator, and EOF
             if proc.returncode is None:
                 proc.terminate()
                 await proc.wait()
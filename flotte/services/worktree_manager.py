@@ -2,12 +2,34 @@ import json
 import os
 import re
 import subprocess
+import time
 from pathlib import Path
 
 from ..models import Worktree
 
 PORT_OFFSET_INCREMENT = 100
 
+# Line of `git worktree list` output: '/path/to/worktree  hash [branch]'
+_WORKTREE_LINE_RE = re.compile(r"^(\S+)\s+\w+\s+\[(.+?)\]")
+
+# Run of characters not allowed in directory and project names
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# Copies /source/<i> into /dest/<i> for each index argument, all at once,
+# inside a single alpine container, printing "OK <i>" or "FAIL <i>" as each
+# copy finishes. A tar pipe streams files in bulk, which is much faster than
+# cp -a on volumes with many small files; ownership, permissions and
+# timestamps are preserved.
+VOLUME_COPY_SCRIPT = (
+    "set -o pipefail; "
+    'for i in "$@"; do '
+    "(tar -C /source/$i -cf - . | tar -C /dest/$i -xpf - "
+    '&& echo "OK $i" || echo "FAIL $i") & '
+    "done; wait"
+)
+VOLUME_COPY_TIMEOUT = 300.0  # seconds allowed per volume
+TERMINATE_TIMEOUT = 5.0  # seconds a cancelled command gets to exit before SIGKILL
+
 
 class WorktreeManager:
     """Git worktree discovery, port allocation, and lifecycle management."""
@@ -24,6 +46,10 @@ class WorktreeManager:
         self.worktree_prefix = worktree_prefix  # "" = no prefix
         self.worktrees: dict[str, Worktree] = {}
         self._cached_volumes: list[str] | None = None
+        self._cached_branches: tuple[float, list[str]] | None = None
+        self._cached_branch_set: frozenset[str] | None = None
+        # Parsed .env files with the (mtime_ns, size) they were read at
+        self._env_cache: dict[Path, tuple[int, int, dict[str, str]]] = {}
 
     def _run_command(
         self, *args: str, cwd: Path | None = None, timeout: float = 60.0
@@ -33,7 +59,6 @@ class WorktreeManager:
             result = subprocess.run(
                 args,
                 cwd=cwd or self.main_repo_path,
-                env=os.environ,
                 capture_output=True,
                 timeout=timeout,
             )
@@ -45,6 +70,40 @@ class WorktreeManager:
         except subprocess.TimeoutExpired:
             return (-1, "", "Command timed out")
 
+    async def _run_command_async(
+        self, *args: str, cwd: Path | None = None, timeout: float = 60.0
+    ) -> tuple[int, str, str]:
+        """Execute a command without blocking the event loop and return results."""
+        import asyncio
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd or self.main_repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return (-1, "", "Command timed out")
+        except asyncio.CancelledError:
+            # Don't leave the command running. SIGTERM first so git can
+            # remove any lock file it holds; SIGKILL only if it hangs.
+            if proc.returncode is None:
+                proc.terminate()
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=TERMINATE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+            raise
+        return (
+            proc.returncode or 0,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
     async def discover_worktrees(self) -> list[Worktree]:
         """
         Discover all git worktrees and their configurations.
@@ -52,83 +111,127 @@ class WorktreeManager:
         Returns:
             List of Worktree objects
         """
-        returncode, stdout, stderr = self._run_command(
+        returncode, stdout, stderr = await self._run_command_async(
             "git", "-C", str(self.main_repo_path), "worktree", "list"
         )
 
         if returncode != 0:
             return []
 
-        worktrees = []
-        # Parse format: '/path/to/worktree  hash [branch]'
-        pattern = re.compile(r"^(\S+)\s+\w+\s+\[(.+?)\]")
-
-        for line in stdout.strip().split("\n"):
+        listed = []
+        for line in stdout.splitlines():
             if not line.strip():
                 continue
 
-            match = pattern.match(line)
-            if not match:
-                continue
+            match = _WORKTREE_LINE_RE.match(line)
+            if match:
+                listed.append(match.groups())
 
-            path_str, branch = match.groups()
-            path = Path(path_str)
+        # Resolving paths and reading .env files is blocking filesystem work:
+        # do all of it in one worker thread rather than on the event loop
+        import asyncio
+        found = await asyncio.to_thread(
+            lambda: [self._load_worktree(path_str, branch) for path_str, branch in listed]
+        )
 
-            # Skip worktrees whose directories no longer exist
-            if not path.exists():
-                continue
+        worktrees = []
+        for worktree in found:
+            if worktree is not None:
+                worktrees.append(worktree)
+                self.worktrees[worktree.name] = worktree
 
-            # Read .env if exists
-            env_vars = self._parse_env(path)
+        self._cached_branch_set = None
+        return worktrees
 
-            # Determine if this is the main repo
-            is_main = path.resolve() == self.main_repo_path.resolve()
+    def _load_worktree(self, path_str: str, branch: str) -> Worktree | None:
+        """
+        Build a Worktree from a `git worktree list` entry.
 
-            # Sanitize name from path
-            if is_main:
-                name = "main"
-            elif self.worktree_prefix:
-                name = path.name.removeprefix(self.worktree_prefix)
-            else:
-                name = path.name
+        Args:
+            path_str: Worktree path as listed by git
+            branch: Checked-out branch
 
-            # Get compose project name - default to directory name (what docker compose uses)
-            compose_project_name = env_vars.get(
-                "COMPOSE_PROJECT_NAME", path.name
-            )
+        Returns:
+            The Worktree, or None if its directory no longer exists
+        """
+        path = Path(path_str)
 
-            worktree = Worktree(
-                name=name,
-                path=path,
-                branch=branch,
-                compose_project_name=compose_project_name,
-                is_main=is_main,
-            )
-            worktrees.append(worktree)
-            self.worktrees[name] = worktree
+        # Skip worktrees whose directories no longer exist (strict
+        # resolve checks existence and resolves in one go)
+        try:
+            resolved = path.resolve(strict=True)
+        except OSError:
+            return None
 
-        return worktrees
+        # Read .env if exists
+        env_vars = self._parse_env(path)
+
+        # Determine if this is the main repo (resolved in __init__)
+        is_main = resolved == self.main_repo_path
+
+        # Sanitize name from path
+        if is_main:
+            name = "main"
+        elif self.worktree_prefix:
+            name = path.name.removeprefix(self.worktree_prefix)
+        else:
+            name = path.name
+
+        # Get compose project name - default to directory name (what docker compose uses)
+        compose_project_name = env_vars.get(
+            "COMPOSE_PROJECT_NAME", path.name
+        )
+
+        return Worktree(
+            name=name,
+            path=path,
+            branch=branch,
+            compose_project_name=compose_project_name,
+            is_main=is_main,
+        )
+
+    @property
+    def branch_set(self) -> frozenset[str]:
+        """Branches that already have a worktree (cached until worktrees change)."""
+        if self._cached_branch_set is None:
+            self._cached_branch_set = frozenset(
+                wt.branch for wt in self.worktrees.values()
+            )
+        return self._cached_branch_set
 
     def _parse_env(self, path: Path) -> dict[str, str]:
-        """Parse .env file into dict."""
+        """Parse .env file into dict.
+
+        Results are cached per file until its mtime or size changes; treat
+        the returned dict as read-only.
+        """
         env_file = path / ".env"
-        if not env_file.exists():
+        try:
+            st = env_file.stat()
+        except OSError:
             return {}
 
+        cached = self._env_cache.get(env_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
         env_vars = {}
         try:
             with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and blank lines
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        env_vars[key.strip()] = value.strip()
+                lines = f.read().splitlines()
         except (OSError, IOError):
-            pass
+            return env_vars
+
+        for line in lines:
+            line = line.strip()
+            # Skip comments and blank lines
+            if not line or line[0] == "#":
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                env_vars[key.strip()] = value.strip()
 
+        self._env_cache[env_file] = (st.st_mtime_ns, st.st_size, env_vars)
         return env_vars
 
     def get_compose_project_prefix(self) -> str:
@@ -136,10 +239,15 @@ class WorktreeManager:
         main_env = self._parse_env(self.main_repo_path)
         return main_env.get("COMPOSE_PROJECT_NAME", self.project_name)
 
-    def _get_port_offset(self, env_vars: dict[str, str]) -> int:
-        """Calculate port offset by comparing a *_PORT variable to main's .env."""
-        main_env = self._parse_env(self.main_repo_path)
+    def _get_port_offset(
+        self, env_vars: dict[str, str], main_env: dict[str, str]
+    ) -> int:
+        """Calculate port offset by comparing a *_PORT variable to main's .env.
 
+        Args:
+            env_vars: Parsed .env of the worktree
+            main_env: Parsed .env of the main repo
+        """
         # Find first *_PORT variable that exists in both
         for key, value in env_vars.items():
             if key.endswith("_PORT") and key in main_env:
@@ -161,21 +269,25 @@ class WorktreeManager:
 
         # Scan all {worktree_prefix}-* directories
         if self.parent_dir.exists() and self.worktree_prefix:
-            for path in self.parent_dir.iterdir():
-                if path.is_dir() and path.name.startswith(self.worktree_prefix):
-                    env_vars = self._parse_env(path)
-                    offset = self._get_port_offset(env_vars)
-                    if offset > max_offset:
-                        max_offset = offset
+            # Read main's .env once, not once per sibling worktree
+            main_env = self._parse_env(self.main_repo_path)
+            # scandir entries know their type from readdir, so checking the
+            # name first and then is_dir() avoids a stat() per entry
+            with os.scandir(self.parent_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(self.worktree_prefix) and entry.is_dir():
+                        env_vars = self._parse_env(Path(entry.path))
+                        offset = self._get_port_offset(env_vars, main_env)
+                        if offset > max_offset:
+                            max_offset = offset
 
         return max_offset + PORT_OFFSET_INCREMENT
 
     def _sanitize_branch_name(self, branch_name: str) -> str:
         """Sanitize branch name for use in directory and project names."""
-        # Replace non-alphanumeric with dash
-        sanitized = re.sub(r"[^a-zA-Z0-9]", "-", branch_name)
-        # Remove leading/trailing dashes and collapse multiple dashes
-        sanitized = re.sub(r"-+", "-", sanitized).strip("-")
+        # Replace each run of non-alphanumerics with a single dash, then
+        # remove leading/trailing dashes
+        sanitized = _NON_ALNUM_RUN_RE.sub("-", branch_name).strip("-")
         # Truncate to 30 chars
         return sanitized[:30].lower()
 
@@ -233,6 +345,7 @@ class WorktreeManager:
 
         if returncode != 0:
             raise RuntimeError(f"Failed to create worktree: {stderr}")
+        self._cached_branches = None
 
         # Get next port offset and generate .env
         offset = self.find_next_port_offset()
@@ -248,6 +361,7 @@ class WorktreeManager:
             is_main=False,
         )
         self.worktrees[sanitized_name] = worktree
+        self._cached_branch_set = None
         return worktree
 
     async def create_worktree(
@@ -300,36 +414,79 @@ class WorktreeManager:
         with open(env_file, "w") as f:
             f.write("\n".join(lines) + "\n")
 
-    def get_volumes_sync(self) -> list[str]:
-        """Get volume names from docker-compose.yml (synchronous)."""
-        if self._cached_volumes is not None:
-            return self._cached_volumes
+    async def get_cached_branches(self, max_age: float = 5.0) -> list[str]:
+        """
+        Get local git branch names, reusing a recent result.
+
+        Args:
+            max_age: Seconds a cached branch list stays valid
+
+        Returns:
+            Branch names in git's order
+        """
+        now = time.monotonic()
+        if self._cached_branches is not None:
+            fetched_at, branches = self._cached_branches
+            if now - fetched_at < max_age:
+                return branches
 
-        returncode, stdout, stderr = self._run_command(
+        import asyncio
+        proc = await asyncio.create_subprocess_exec(
+            "git", "branch", "--format=%(refname:short)",
+            cwd=self.main_repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+
+        branches = [
+            branch for line in stdout.decode().splitlines()
+            if (branch := line.strip())
+        ]
+        self._cached_branches = (now, branches)
+        return branches
+
+    async def _get_compose_config(self) -> dict | None:
+        """Get the main repo's resolved compose config.
+
+        Returns None if docker compose config fails (e.g., Docker not running,
+        no docker-compose.yml, invalid config).
+        """
+        returncode, stdout, stderr = await self._run_command_async(
             "docker", "compose", "config", "--format", "json",
             cwd=self.main_repo_path,
             timeout=30.0,
         )
         if returncode != 0:
-            # Fallback to empty list if compose config fails
-            return []
+            return None
 
         try:
-            config = json.loads(stdout)
-            self._cached_volumes = list(config.get("volumes", {}).keys())
-            return self._cached_volumes
+            return json.loads(stdout)
         except json.JSONDecodeError:
-            return []
+            return None
 
     async def get_volumes(self) -> list[str]:
-        """Get volume names from docker-compose.yml (async wrapper)."""
+        """Get volume names from docker-compose.yml."""
         if self._cached_volumes is not None:
             return self._cached_volumes
-        import asyncio
-        return await asyncio.to_thread(self.get_volumes_sync)
 
-    def get_gitignored_bind_mounts_sync(self) -> list[str]:
-        """Get gitignored bind mount paths from docker-compose.yml (synchronous).
+        # --volumes prints just the names, so the full config needn't be parsed
+        returncode, stdout, stderr = await self._run_command_async(
+            "docker", "compose", "config", "--volumes",
+            cwd=self.main_repo_path,
+            timeout=30.0,
+        )
+        if returncode != 0:
+            # Fallback to empty list if compose config fails
+            return []
+
+        self._cached_volumes = [
+            volume for line in stdout.splitlines() if (volume := line.strip())
+        ]
+        return self._cached_volumes
+
+    async def get_gitignored_bind_mounts(self) -> list[str]:
+        """Get gitignored bind mount paths from docker-compose.yml.
 
         Returns relative paths like 'files' or 'config/local.yml' (without ./ prefix).
         Includes both files and directories. Follows symlinks (copies target contents).
@@ -338,17 +495,8 @@ class WorktreeManager:
         no docker-compose.yml, invalid config) - this is intentional to allow
         worktree creation to proceed without bind mount cloning.
         """
-        returncode, stdout, stderr = self._run_command(
-            "docker", "compose", "config", "--format", "json",
-            cwd=self.main_repo_path,
-            timeout=30.0,
-        )
-        if returncode != 0:
-            return []
-
-        try:
-            config = json.loads(stdout)
-        except json.JSONDecodeError:
+        config = await self._get_compose_config()
+        if config is None:
             return []
 
         # Extract bind mount paths from all services
@@ -373,19 +521,12 @@ class WorktreeManager:
             return []
 
         # Filter to only gitignored paths
-        returncode, stdout, stderr = self._run_command(
+        returncode, stdout, stderr = await self._run_command_async(
             "git", "check-ignore", *bind_mounts,
             cwd=self.main_repo_path,
         )
         # git check-ignore returns ignored paths (exit 0) or nothing (exit 1)
-        if stdout.strip():
-            return stdout.strip().split("\n")
-        return []
-
-    async def get_gitignored_bind_mounts(self) -> list[str]:
-        """Get gitignored bind mount paths from docker-compose.yml (async wrapper)."""
-        import asyncio
-        return await asyncio.to_thread(self.get_gitignored_bind_mounts_sync)
+        return stdout.splitlines()
 
     def _clone_bind_mount_sync(
         self,
@@ -439,52 +580,70 @@ class WorktreeManager:
         source_project: str,
         target_project: str,
         on_progress: callable = None,
-    ) -> bool:
+    ) -> list[str]:
         """
         Clone Docker volumes from source project to target project.
 
+        All volumes are copied concurrently by one alpine container, so the
+        container startup cost is paid once rather than per volume. docker
+        run creates the target volumes on first mount.
+
         Args:
             source_project: Source compose project name (e.g., 'myproject')
             target_project: Target compose project name (e.g., 'myproject-feature')
-            on_progress: Optional callback(volume_name, current, total) for progress
+            on_progress: Optional callback(volume_name, done, total), called
+                as each volume finishes copying
 
         Returns:
-            True if successful
+            Names of volumes that failed to copy (empty if all succeeded)
         """
+        import asyncio
+
         volumes = await self.get_volumes()
-        total = len(volumes)
+        if not volumes:
+            return []
 
+        mounts: list[str] = []
         for i, volume_name in enumerate(volumes):
-            source_vol = f"{source_project}_{volume_name}"
-            target_vol = f"{target_project}_{volume_name}"
-
-            if on_progress:
-                on_progress(volume_name, i + 1, total)
-
-            # Create target volume
-            self._run_command(
-                "docker", "volume", "create", target_vol
-            )
-
-            # Copy data using alpine container
-            returncode, stdout, stderr = self._run_command(
-                "docker", "run", "--rm",
-                "-v", f"{source_vol}:/source:ro",
-                "-v", f"{target_vol}:/dest",
-                "alpine",
-                "sh", "-c", "cp -a /source/. /dest/",
-                timeout=300.0,  # 5 min per volume
-            )
-
-            if returncode != 0:
-                # Log error but continue with other volumes
-                pass
+            mounts += [
+                "-v", f"{source_project}_{volume_name}:/source/{i}:ro",
+                "-v", f"{target_project}_{volume_name}:/dest/{i}",
+            ]
+
+        proc = await asyncio.create_subprocess_exec(
+            "docker", "run", "--rm", *mounts,
+            "alpine", "sh", "-c", VOLUME_COPY_SCRIPT, "sh",
+            *(str(i) for i in range(len(volumes))),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
 
-        return True
+        # Volumes that never report back (e.g. docker run failed) count as failed
+        pending = set(volumes)
+        done = 0
+        try:
+            async with asyncio.timeout(VOLUME_COPY_TIMEOUT * len(volumes)):
+                assert proc.stdout is not None
+                async for line in proc.stdout:
+                    result, _, index = line.decode().partition(" ")
+                    if not index.strip().isdigit():
+                        continue
+                    volume_name = volumes[int(index)]
+                    if result == "OK":
+                        pending.discard(volume_name)
+                    done += 1
+                    if on_progress:
+                        on_progress(volume_name, done, len(volumes))
+                await proc.wait()
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+        return [volume_name for volume_name in volumes if volume_name in pending]
 
-    def cleanup_docker_sync(self, worktree: Worktree) -> bool:
+    async def cleanup_docker(self, worktree: Worktree) -> bool:
         """
-        Clean up Docker resources for a worktree (synchronous).
+        Clean up Docker resources for a worktree.
 
         Keeps the git worktree and code intact.
 
@@ -503,7 +662,7 @@ class WorktreeManager:
             # No compose file means no containers to stop - just skip
             return True
 
-        returncode, stdout, stderr = self._run_command(
+        returncode, stdout, stderr = await self._run_command_async(
             "docker",
             "compose",
             "-f",
@@ -520,34 +679,17 @@ class WorktreeManager:
         if returncode != 0:
             raise RuntimeError(f"docker compose down failed: {stderr}")
 
-        # Explicitly remove all associated volumes (ignore errors - some may not exist)
-        volumes = self.get_volumes_sync()
-        for volume_name in volumes:
-            full_volume_name = f"{worktree.compose_project_name}_{volume_name}"
-            self._run_command(
-                "docker", "volume", "rm", "-f", full_volume_name
+        # Explicitly remove all associated volumes in one call
+        # (ignore errors - -f skips volumes that don't exist)
+        volumes = await self.get_volumes()
+        if volumes:
+            await self._run_command_async(
+                "docker", "volume", "rm", "-f",
+                *(f"{worktree.compose_project_name}_{name}" for name in volumes),
             )
 
         return True
 
-    async def cleanup_docker(self, worktree: Worktree) -> bool:
-        """
-        Clean up Docker resources for a worktree (async wrapper).
-
-        Keeps the git worktree and code intact.
-
-        Args:
-            worktree: The worktree to clean up
-
-        Returns:
-            True if successful
-
-        Raises:
-            RuntimeError: If cleanup fails
-        """
-        import asyncio
-        return await asyncio.to_thread(self.cleanup_docker_sync, worktree)
-
     async def commit_all_changes(self, worktree: Worktree, message: str) -> bool:
         """
         Commit all changes in a worktree (staged, modified, and untracked).
@@ -563,7 +705,7 @@ class WorktreeManager:
             RuntimeError: If commit fails
         """
         # Stage all changes
-        returncode, stdout, stderr = self._run_command(
+        returncode, stdout, stderr = await self._run_command_async(
             "git", "add", "-A",
             cwd=worktree.path,
         )
@@ -571,7 +713,7 @@ class WorktreeManager:
             raise RuntimeError(f"git add failed: {stderr}")
 
         # Commit
-        returncode, stdout, stderr = self._run_command(
+        returncode, stdout, stderr = await self._run_command_async(
             "git", "commit", "-m", message,
             cwd=worktree.path,
         )
@@ -580,9 +722,9 @@ class WorktreeManager:
 
         return True
 
-    def remove_worktree_sync(self, worktree: Worktree) -> bool:
+    async def remove_worktree(self, worktree: Worktree) -> bool:
         """
-        Remove a git worktree (synchronous, keeps the branch).
+        Remove a git worktree (keeps the branch).
 
         Args:
             worktree: The worktree to remove
@@ -595,7 +737,7 @@ class WorktreeManager:
         """
         # Docker may have created root-owned files. Clean them up using Docker.
         if worktree.path.exists():
-            self._run_command(
+            await self._run_command_async(
                 "docker", "run", "--rm",
                 "-v", f"{worktree.path}:/worktree",
                 "alpine", "rm", "-rf", "/worktree",
@@ -604,13 +746,13 @@ class WorktreeManager:
 
         # If directory still exists (docker cleanup failed), try regular rm
         if worktree.path.exists():
-            self._run_command(
+            await self._run_command_async(
                 "rm", "-rf", str(worktree.path),
                 timeout=30.0,
             )
 
         # Prune dangling worktree references
-        self._run_command(
+        await self._run_command_async(
             "git", "worktree", "prune",
             cwd=self.main_repo_path,
         )
@@ -618,25 +760,10 @@ class WorktreeManager:
         # Remove from cache
         if worktree.name in self.worktrees:
             del self.worktrees[worktree.name]
+            self._cached_branch_set = None
 
         return True
 
-    async def remove_worktree(self, worktree: Worktree) -> bool:
-        """
-        Remove a git worktree (async wrapper, keeps the branch).
-
-        Args:
-            worktree: The worktree to remove
-
-        Returns:
-            True if successful
-
-        Raises:
-            RuntimeError: If removal fails
-        """
-        import asyncio
-        return await asyncio.to_thread(self.remove_worktree_sync, worktree)
-
     async def get_git_status(self, worktree: Worktree) -> dict:
         """
         Get git status for a worktree.
@@ -656,32 +783,31 @@ class WorktreeManager:
             "behind": 0,
         }
 
-        # Get status --porcelain for file counts
-        returncode, stdout, _ = self._run_command(
-            "git", "status", "--porcelain",
+        # One porcelain v2 status gives both the file counts and, via the
+        # branch.ab header, the ahead/behind counts against upstream.
+        # --no-optional-locks: a background refresh must never take the
+        # index lock and get in the way of the user's own git commands
+        returncode, stdout, _ = await self._run_command_async(
+            "git", "--no-optional-locks", "status", "--porcelain=v2", "--branch",
             cwd=worktree.path,
         )
-        if returncode == 0 and stdout.strip():
-            for line in stdout.strip().split("\n"):
-                if not line:
-                    continue
-                status = line[:2]
+        if returncode != 0:
+            return result
+
+        for line in stdout.splitlines():
+            kind = line[:2]
+            if kind == "? ":  # Untracked
+                result["untracked"] += 1
+            elif kind in ("1 ", "2 ", "u "):  # Changed, renamed/copied, unmerged
+                status = line[2:4]
                 if status[0] in "MADRC":  # Staged
                     result["staged"] += 1
                 if status[1] == "M":  # Modified in working tree
                     result["modified"] += 1
-                if status == "??":  # Untracked
-                    result["untracked"] += 1
-
-        # Get ahead/behind counts
-        returncode, stdout, _ = self._run_command(
-            "git", "rev-list", "--left-right", "--count", "@{upstream}...HEAD",
-            cwd=worktree.path,
-        )
-        if returncode == 0 and stdout.strip():
-            parts = stdout.strip().split()
-            if len(parts) == 2:
-                result["behind"] = int(parts[0])
-                result["ahead"] = int(parts[1])
+            elif line.startswith("# branch.ab "):
+                # "# branch.ab +<ahead> -<behind>", only present with an upstream
+                ahead, behind = line[12:].split()
+                result["ahead"] = int(ahead)
+                result["behind"] = -int(behind)
 
         return result
@@ -4,19 +4,24 @@ Single source of truth for:
 - Theme color parsing from TCSS files
 - Status icons and colors for WorktreeStatus, ContainerState, StepStatus
 """
+import functools
 import logging
 import re
 from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Union
 
 from .models import WorktreeStatus
 from .models.container import ContainerState
 
 logger = logging.getLogger(__name__)
 
+# $var: #hex; declaration in a theme TCSS file (6 or 8 digit hex, alpha ignored)
+_TCSS_VAR_RE = re.compile(r'\$(\w+):\s*#([0-9a-fA-F]{6})(?:[0-9a-fA-F]{2})?')
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ThemeColors:
     """Color palette parsed from a TCSS theme file."""
     green: str
@@ -68,7 +73,7 @@ def load_theme_colors(theme_name: str) -> ThemeColors:
 
     # Parse $var: #hex; patterns (supports 6 or 8 digit hex, ignores alpha)
     colors = {}
-    for match in re.finditer(r'\$(\w+):\s*#([0-9a-fA-F]{6})(?:[0-9a-fA-F]{2})?', content):
+    for match in _TCSS_VAR_RE.finditer(content):
         colors[match.group(1)] = f"#{match.group(2)}"
 
     # Validate required variables
@@ -149,14 +154,11 @@ def get_status_style(
     Returns:
         Tuple of (icon_string_or_None, hex_color_string)
     """
+    # The enum style tables cover every member, so index them directly
     if isinstance(status, WorktreeStatus):
-        icon, color_attr = _WORKTREE_STYLES.get(
-            status, _WORKTREE_STYLES[WorktreeStatus.UNKNOWN]
-        )
+        icon, color_attr = _WORKTREE_STYLES[status]
     elif isinstance(status, ContainerState):
-        icon, color_attr = _CONTAINER_STYLES.get(
-            status, _CONTAINER_STYLES[ContainerState.UNKNOWN]
-        )
+        icon, color_attr = _CONTAINER_STYLES[status]
     elif isinstance(status, str) and status in _STEP_STYLES:
         # StepStatus passed as .value string
         icon, color_attr = _STEP_STYLES[status]
@@ -165,3 +167,34 @@ def get_status_style(
         return ("?", colors.dim)
 
     return (icon, getattr(colors, color_attr))
+
+
+@functools.lru_cache(maxsize=16)
+def status_table(
+    colors: ThemeColors,
+    statuses: type[Enum],
+    render: Callable[[Any, str | None, str], Any],
+) -> dict[Any, Any]:
+    """Render every member of a status enum once per palette.
+
+    Widgets index the returned dict instead of resolving the style and
+    building markup or a Text for each status they show.
+
+    Args:
+        colors: ThemeColors instance with hex color values
+        statuses: WorktreeStatus, ContainerState or StepStatus
+        render: Module-level function (status, icon, color_hex) -> cell.
+            It is part of the cache key, so never pass a lambda
+
+    Returns:
+        Dict of status -> rendered cell, shared between callers (read-only)
+    """
+    table = {}
+    for status in statuses:
+        if isinstance(status, (WorktreeStatus, ContainerState)):
+            icon, color = get_status_style(status, colors)
+        else:
+            # StepStatus lives in widgets, so its styles are keyed by value
+            icon, color = get_status_style(status.value, colors)
+        table[status] = render(status, icon, color)
+    return table
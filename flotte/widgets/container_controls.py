@@ -1,10 +1,23 @@
 from textual.containers import Horizontal
 from textual.widgets import Button, Static
 from textual.reactive import reactive
-from textual.css.query import NoMatches
 
 from ..models.worktree import WorktreeStatus
 
+# Status -> disabled flags for (start, stop, restart, ride, delete);
+# None for delete means "disabled only for the main worktree"
+_BUSY = (True, True, True, True, True)
+_BUTTON_DISABLED: dict[WorktreeStatus, tuple[bool, bool, bool, bool, bool | None]] = {
+    WorktreeStatus.STOPPED: (False, True, True, True, None),
+    WorktreeStatus.RUNNING: (False, False, False, False, True),
+    WorktreeStatus.STARTING: _BUSY,
+    WorktreeStatus.STOPPING: _BUSY,
+    WorktreeStatus.CREATING: _BUSY,
+    WorktreeStatus.DELETING: _BUSY,
+    WorktreeStatus.ERROR: _BUSY,
+    WorktreeStatus.UNKNOWN: (False, True, True, True, True),
+}
+
 
 class ContainerControls(Horizontal):
     """Control buttons for container actions."""
@@ -38,55 +51,39 @@ class ContainerControls(Horizontal):
         yield Static("", classes="spacer")
         yield Button("Delete", id="btn-delete-worktree", variant="warning")
 
+    def on_mount(self) -> None:
+        # Look the buttons up once; the watchers below run on every change
+        self._start_btn = self.query_one("#btn-container-start", Button)
+        self._stop_btn = self.query_one("#btn-container-stop", Button)
+        self._restart_btn = self.query_one("#btn-container-restart", Button)
+        self._ride_btn = self.query_one("#btn-ride", Button)
+        self._delete_btn = self.query_one("#btn-delete-worktree", Button)
+
+        # Apply any state set before the buttons were available
+        self._delete_btn.display = not self.is_main
+        self._update_button_states()
+
     def watch_status(self, value: WorktreeStatus) -> None:
         """Enable/disable buttons based on status."""
         self._update_button_states()
 
     def watch_is_main(self, value: bool) -> None:
         """Hide delete button for main worktree."""
-        try:
-            delete_btn = self.query_one("#btn-delete-worktree", Button)
-            delete_btn.display = not value
-        except NoMatches:
-            pass
+        if not hasattr(self, "_delete_btn"):
+            return  # Widgets not mounted yet
+        self._delete_btn.display = not value
         self._update_button_states()
 
     def _update_button_states(self) -> None:
         """Update all button states based on status and is_main."""
-        try:
-            start_btn = self.query_one("#btn-container-start", Button)
-            stop_btn = self.query_one("#btn-container-stop", Button)
-            restart_btn = self.query_one("#btn-container-restart", Button)
-            ride_btn = self.query_one("#btn-ride", Button)
-            delete_btn = self.query_one("#btn-delete-worktree", Button)
-        except NoMatches:
+        if not hasattr(self, "_start_btn"):
             return  # Widgets not mounted yet
 
-        status = self.status
-
-        if status == WorktreeStatus.STOPPED:
-            start_btn.disabled = False
-            stop_btn.disabled = True
-            restart_btn.disabled = True
-            ride_btn.disabled = True
-            delete_btn.disabled = self.is_main
-        elif status == WorktreeStatus.RUNNING:
-            start_btn.disabled = False
-            stop_btn.disabled = False
-            restart_btn.disabled = False
-            ride_btn.disabled = False
-            delete_btn.disabled = True
-        elif status in (WorktreeStatus.STARTING, WorktreeStatus.STOPPING,
-                       WorktreeStatus.CREATING, WorktreeStatus.DELETING,
-                       WorktreeStatus.ERROR):
-            start_btn.disabled = True
-            stop_btn.disabled = True
-            restart_btn.disabled = True
-            ride_btn.disabled = True
-            delete_btn.disabled = True
-        else:  # UNKNOWN
-            start_btn.disabled = False
-            stop_btn.disabled = True
-            restart_btn.disabled = True
-            ride_btn.disabled = True
-            delete_btn.disabled = True
+        start, stop, restart, ride, delete = _BUTTON_DISABLED.get(
+            self.status, _BUTTON_DISABLED[WorktreeStatus.UNKNOWN]
+        )
+        self._start_btn.disabled = start
+        self._stop_btn.disabled = stop
+        self._restart_btn.disabled = restart
+        self._ride_btn.disabled = ride
+        self._delete_btn.disabled = self.is_main if delete is None else delete
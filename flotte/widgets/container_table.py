@@ -3,7 +3,12 @@ from textual.reactive import reactive
 from rich.text import Text
 
 from ..models import Worktree, Container, ContainerState
-from ..theme import get_status_style
+from ..theme import status_table
+
+
+def _state_text(state: ContainerState, icon: None, color: str) -> Text:
+    """State name colored by state; container states have no icon."""
+    return Text(state.value, style=color)
 
 
 class ContainerTable(DataTable):
@@ -19,6 +24,14 @@ class ContainerTable(DataTable):
 
     worktree: reactive[Worktree | None] = reactive(None, always_update=True)
 
+    # Column keys, in the order _row_values returns cell values
+    _COLUMNS = ("service", "ports", "state", "status", "name")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Cell values currently shown, keyed by service in row order
+        self._rendered: dict[str, tuple] = {}
+
     def on_mount(self) -> None:
         """Set up table columns and appearance."""
         self.cursor_type = "none"
@@ -32,35 +45,60 @@ class ContainerTable(DataTable):
         self.add_column("Container Name", key="name", width=50)
 
     def watch_worktree(self, worktree: Worktree | None) -> None:
-        """React to worktree selection changes."""
-        # Clear all existing rows
-        self.clear()
-
+        """React to worktree selection changes and polls."""
         if worktree is None:
+            self.clear()
+            self._rendered = {}
+            return
+
+        # container_list returns a sorted list
+        containers = worktree.container_list
+
+        # Same rows as shown (the usual case for a poll): update changed cells only
+        if [c.service for c in containers] == list(self._rendered):
+            for container in containers:
+                self._update_row(container)
             return
 
-        # Add rows for each container (container_list returns sorted list)
-        for container in worktree.container_list:
+        # Services added or removed, or a different worktree: rebuild
+        self.clear()
+        self._rendered = {}
+        for container in containers:
             self._add_container_row(container)
 
         # Force refresh to ensure display updates
         self.refresh()
 
-    def _add_container_row(self, container: Container) -> None:
-        """Add a row for a container."""
-        self.add_row(
+    def _row_values(self, container: Container) -> tuple:
+        """Cell values for a container, in _COLUMNS order."""
+        return (
             container.service,
             ", ".join(container.ports) if container.ports else "-",
             self._format_state(container.state),
             container.status,
             self._truncate(container.name, 50),
-            key=container.service,
         )
 
+    def _add_container_row(self, container: Container) -> None:
+        """Add a row for a container."""
+        values = self._row_values(container)
+        self.add_row(*values, key=container.service)
+        self._rendered[container.service] = values
+
+    def _update_row(self, container: Container) -> None:
+        """Update the cells of a container's row that changed."""
+        values = self._row_values(container)
+        shown = self._rendered[container.service]
+        if values == shown:
+            return
+        for column, value, old in zip(self._COLUMNS, values, shown):
+            if value != old:
+                self.update_cell(container.service, column, value)
+        self._rendered[container.service] = values
+
     def _format_state(self, state: ContainerState) -> Text:
         """Format state with color coding."""
-        _, color = get_status_style(state, self.app.theme_colors)
-        return Text(state.value, style=color)
+        return status_table(self.app.theme_colors, ContainerState, _state_text)[state]
 
     def _truncate(self, text: str, max_len: int) -> str:
         """Truncate text with ellipsis if too long."""
@@ -75,16 +113,9 @@ class ContainerTable(DataTable):
         Use this for real-time updates during polling to avoid
         full table refresh.
         """
-        try:
-            # Get row index by key (service name)
-            row_key = container.service
-
-            # Update cells
-            self.update_cell(row_key, "state", self._format_state(container.state))
-            self.update_cell(row_key, "status", container.status)
-        except KeyError:
-            # Container not in table, might need full refresh
-            pass
+        # Container not in table: it needs a full refresh
+        if container.service in self._rendered:
+            self._update_row(container)
 
     def get_selected_container(self) -> Container | None:
         """Get the currently selected container, if any."""
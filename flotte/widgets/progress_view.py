@@ -1,8 +1,9 @@
 from enum import Enum
+
 from textual.widgets import Static
 from textual.reactive import reactive
 
-from ..theme import get_status_style, DEFAULT_COLORS
+from ..theme import status_table, DEFAULT_COLORS
 
 
 class StepStatus(Enum):
@@ -12,12 +13,25 @@ class StepStatus(Enum):
     ERROR = "error"
 
 
+def _step_prefix(status: StepStatus, icon: str, color: str) -> str:
+    """Indent and colored icon that precede a step name."""
+    return f"  [{color}]{icon}[/{color}] "
+
+
 class ProgressView(Static):
     """Shows operation progress with title and step checklist."""
 
     title: reactive[str] = reactive("")
     steps: reactive[tuple[tuple[str, StepStatus], ...]] = reactive(())
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._colors = DEFAULT_COLORS  # Replaced by the app palette on mount
+
+    def on_mount(self) -> None:
+        # The palette is loaded once at startup, so resolve it once here
+        self._colors = self.app.theme_colors
+
     def set_operation(self, title: str, step_names: list[str]) -> None:
         """Initialize operation with title and steps."""
         self.title = title
@@ -52,17 +66,11 @@ class ProgressView(Static):
         self.steps = ()
 
     def render(self) -> str:
-        # Guard: app may not be available during early renders
-        if hasattr(self, 'app') and self.app:
-            colors = self.app.theme_colors
-        else:
-            colors = DEFAULT_COLORS
-
+        markup = status_table(self._colors, StepStatus, _step_prefix)
         lines = []
         if self.title:
             lines.append(f"[bold]{self.title}[/bold]")
             lines.append("")
         for name, status in self.steps:
-            icon, color = get_status_style(status.value, colors)
-            lines.append(f"  [{color}]{icon}[/{color}] {name}")
+            lines.append(markup[status] + name)
         return "\n".join(lines) if lines else ""
@@ -2,7 +2,12 @@ from textual.widgets import Static
 from textual.reactive import reactive
 
 from ..models.worktree import WorktreeStatus
-from ..theme import get_status_style, WORKTREE_STATUS_TEXT, DEFAULT_COLORS
+from ..theme import status_table, WORKTREE_STATUS_TEXT, DEFAULT_COLORS
+
+
+def _status_markup(status: WorktreeStatus, icon: str, color: str) -> str:
+    """Colored status icon followed by the status text."""
+    return f"[{color}]{icon}[/{color}]  {WORKTREE_STATUS_TEXT[status]}"
 
 
 class StatusLine(Static):
@@ -10,14 +15,15 @@ class StatusLine(Static):
 
     status: reactive[WorktreeStatus] = reactive(WorktreeStatus.UNKNOWN)
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._colors = DEFAULT_COLORS  # Replaced by the app palette on mount
+
+    def on_mount(self) -> None:
+        # Runs before the initial watch_status, and the palette is loaded
+        # once at startup, so resolve it once here
+        self._colors = self.app.theme_colors
+
     def watch_status(self, value: WorktreeStatus) -> None:
         """Update display when status changes."""
-        # Guard: app may not be available during early reactive updates
-        if hasattr(self, 'app') and self.app:
-            colors = self.app.theme_colors
-        else:
-            colors = DEFAULT_COLORS
-
-        icon, color = get_status_style(value, colors)
-        text = WORKTREE_STATUS_TEXT.get(value, WORKTREE_STATUS_TEXT[WorktreeStatus.UNKNOWN])
-        self.update(f"[{color}]{icon}[/{color}]  {text}")
+        self.update(status_table(self._colors, WorktreeStatus, _status_markup)[value])
@@ -1,3 +1,7 @@
+import functools
+from operator import itemgetter
+from pathlib import Path
+
 from textual.containers import Vertical
 from textual.widgets import DataTable
 from textual.reactive import reactive
@@ -5,7 +9,55 @@ from textual.message import Message
 from rich.text import Text
 
 from ..models import Worktree, WorktreeStatus
-from ..theme import get_status_style
+from ..theme import ThemeColors, status_table
+
+# Home directory, shown as "~" in the path column
+_HOME = str(Path.home())
+
+# Git status counts in the order the git column shows them
+_git_counts = itemgetter("staged", "modified", "untracked", "ahead", "behind")
+
+
+# Cell renderables are cached and shared between rows and refreshes; the
+# DataTable only reads them, so treat them as read-only.
+
+@functools.lru_cache(maxsize=128)
+def _styled_text(content: str, style: str = "") -> Text:
+    """Build a single-style cell."""
+    return Text(content, style=style)
+
+
+def _status_text(status: WorktreeStatus, icon: str, color: str) -> Text:
+    """Status icon cell of the worktree table."""
+    return Text(icon, style=color)
+
+
+@functools.lru_cache(maxsize=32)
+def _url_text(url: str) -> Text:
+    """Build a clickable URL cell."""
+    return Text.from_markup(f"[@click=app.open_url('{url}')]{url}[/]", style="cyan underline")
+
+
+@functools.lru_cache(maxsize=64)
+def _git_text(counts: tuple[int, int, int, int, int], colors: ThemeColors) -> Text:
+    """Build the git column from (staged, modified, untracked, ahead, behind)."""
+    staged, modified, untracked, ahead, behind = counts
+    text = Text()
+    if staged:
+        text.append(f"+{staged} ", style=colors.green)
+    if modified:
+        text.append(f"~{modified} ", style=colors.yellow)
+    if untracked:
+        text.append(f"?{untracked} ", style=colors.dim)
+    if ahead:
+        text.append(f"↑{ahead} ", style=colors.cyan)
+    if behind:
+        text.append(f"↓{behind} ", style=colors.red)
+
+    if not text.plain:
+        text = Text("clean", style=colors.dim)
+
+    return text
 
 
 class WorktreeChanged(Message):
@@ -19,10 +71,26 @@ class WorktreeChanged(Message):
 class WorktreeTable(DataTable):
     """DataTable for worktrees with status, name, URL, git status."""
 
+    # Column keys, in display order
+    _COLUMNS = ("status", "name", "url", "path", "git")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # List last passed to refresh_worktrees, in display order
         self._worktrees: list[Worktree] = []
+        # Row index of each worktree name in _worktrees
+        self._name_to_index: dict[str, int] = {}
         self._git_statuses: dict[str, dict] = {}
+        # Row inputs (see _row_inputs) as last rendered, in row order
+        self._rendered: dict[str, tuple] = {}
+        # Cell formatters, in column order
+        self._formatters = (
+            self._format_status,
+            self._format_name,
+            self._format_url,
+            self._format_path,
+            self._format_git,
+        )
 
     def on_mount(self) -> None:
         self.cursor_foreground_priority = "renderable"
@@ -35,93 +103,117 @@ class WorktreeTable(DataTable):
 
     def _format_status(self, wt: Worktree) -> Text:
         """Format status icon for a worktree."""
-        icon, color = get_status_style(wt.status, self.app.theme_colors)
-        return Text(icon, style=color)
+        return status_table(self.app.theme_colors, WorktreeStatus, _status_text)[wt.status]
 
     def _format_name(self, wt: Worktree) -> Text:
-        return Text(wt.name, style="bold" if wt.is_main else "")
+        return _styled_text(wt.name, "bold" if wt.is_main else "")
 
     def _format_url(self, wt: Worktree) -> Text:
         """Format URL for a worktree."""
         url = wt.web_url
         if url:
-            return Text.from_markup(f"[@click=app.open_url('{url}')]{url}[/]", style="cyan underline")
-        return Text("-", style="dim")
+            return _url_text(url)
+        return _styled_text("-", "dim")
 
     def _format_path(self, wt: Worktree) -> Text:
-        from pathlib import Path
-        home = str(Path.home())
         path_str = str(wt.path)
-        if path_str.startswith(home):
-            path_str = "~" + path_str[len(home):]
-        return Text(path_str, style="dim")
+        if path_str.startswith(_HOME):
+            path_str = "~" + path_str[len(_HOME):]
+        return _styled_text(path_str, "dim")
 
     def _format_git(self, wt: Worktree) -> Text:
         git_status = self._git_statuses.get(wt.name)
         if not git_status:
-            return Text("")
-
-        colors = self.app.theme_colors
-        text = Text()
-        if git_status["staged"]:
-            text.append(f"+{git_status['staged']} ", style=colors.green)
-        if git_status["modified"]:
-            text.append(f"~{git_status['modified']} ", style=colors.yellow)
-        if git_status["untracked"]:
-            text.append(f"?{git_status['untracked']} ", style=colors.dim)
-        if git_status["ahead"]:
-            text.append(f"↑{git_status['ahead']} ", style=colors.cyan)
-        if git_status["behind"]:
-            text.append(f"↓{git_status['behind']} ", style=colors.red)
-
-        if not text.plain:
-            text = Text("clean", style=colors.dim)
-
-        return text
+            return _styled_text("")
+        return _git_text(_git_counts(git_status), self.app.theme_colors)
 
     def refresh_worktrees(self, worktrees: list[Worktree]) -> None:
         """Update table with worktrees.
 
         Args:
-            worktrees: List of worktrees to display
+            worktrees: Worktrees in display order (e.g. Project.worktree_list)
         """
         # Remember selection before updating list
         selected_name = None
         if self.cursor_row is not None and 0 <= self.cursor_row < len(self._worktrees):
             selected_name = self._worktrees[self.cursor_row].name
 
-        self._worktrees = sorted(worktrees, key=lambda w: (not w.is_main, w.name))
+        # Project.worktree_list is reused until worktrees change, so the same
+        # list object means the same rows in the same order. Project owns
+        # the ordering; the list is shared, so it is only read here.
+        if worktrees is not self._worktrees:
+            self._worktrees = worktrees
+            self._name_to_index = {wt.name: i for i, wt in enumerate(self._worktrees)}
         self._rebuild_table(selected_name)
 
+    def _row_inputs(self, wt: Worktree) -> tuple:
+        """Values each cell of wt's row is rendered from, in column order."""
+        return (
+            wt.status,
+            (wt.name, wt.is_main),
+            wt.web_url,
+            wt.path,
+            self._git_statuses.get(wt.name),
+        )
+
     def _rebuild_table(self, selected_name: str | None = None) -> None:
-        """Rebuild the table rows."""
+        """Bring the table rows up to date.
+
+        When the same worktrees are shown in the same order, only cells whose
+        inputs changed are updated. Otherwise the rows are rebuilt.
+        """
+        names = [wt.name for wt in self._worktrees]
+        if names != list(self._rendered):
+            self._add_all_rows(selected_name)
+            return
+
+        for wt in self._worktrees:
+            inputs = self._row_inputs(wt)
+            previous = self._rendered[wt.name]
+            if inputs == previous:
+                continue
+            for column, formatter, new, old in zip(
+                self._COLUMNS, self._formatters, inputs, previous
+            ):
+                if new != old:
+                    self.update_cell(wt.name, column, formatter(wt))
+            self._rendered[wt.name] = inputs
+
+    def _add_all_rows(self, selected_name: str | None) -> None:
+        """Clear the table and add every row."""
         self.clear()
+        self._rendered = {}
 
         for wt in self._worktrees:
-            self.add_row(
-                self._format_status(wt),
-                self._format_name(wt),
-                self._format_url(wt),
-                self._format_path(wt),
-                self._format_git(wt),
-                key=wt.name,
-            )
+            self.add_row(*(formatter(wt) for formatter in self._formatters), key=wt.name)
+            self._rendered[wt.name] = self._row_inputs(wt)
 
         # Restore selection
         if selected_name:
-            for i, wt in enumerate(self._worktrees):
-                if wt.name == selected_name:
-                    self.move_cursor(row=i)
-                    break
+            self.move_to(selected_name)
+
+    def move_to(self, worktree_name: str) -> None:
+        """Move the cursor to a worktree's row, if it is shown."""
+        row = self._name_to_index.get(worktree_name)
+        if row is not None:
+            self.move_cursor(row=row)
+
+    def update_status(self, worktree: Worktree) -> None:
+        """Update only the status cell of one worktree's row."""
+        rendered = self._rendered.get(worktree.name)
+        if rendered is not None and rendered[0] != worktree.status:
+            self.update_cell(worktree.name, "status", self._format_status(worktree))
+            self._rendered[worktree.name] = (worktree.status, *rendered[1:])
 
     def update_git_status(self, worktree_name: str, git_status: dict) -> None:
         """Update git status for a worktree."""
         self._git_statuses[worktree_name] = git_status
-        # Remember selection before rebuilding
-        selected_name = None
-        if self.cursor_row is not None and 0 <= self.cursor_row < len(self._worktrees):
-            selected_name = self._worktrees[self.cursor_row].name
-        self._rebuild_table(selected_name)
+        rendered = self._rendered.get(worktree_name)
+        if rendered is None or rendered[4] == git_status:
+            return
+        wt = self._worktrees[self._name_to_index[worktree_name]]
+        self.update_cell(worktree_name, "git", self._format_git(wt))
+        self._rendered[worktree_name] = (*rendered[:4], git_status)
 
     def get_selected_worktree(self) -> Worktree | None:
         """Get currently selected worktree."""
@@ -150,6 +242,15 @@ class WorktreeHeader(Vertical):
         table = self.query_one("#worktree-table", WorktreeTable)
         table.refresh_worktrees(worktrees)
 
+    def update_status_for(self, worktree: Worktree) -> None:
+        """Update the status icon of a single worktree without a full rebuild.
+
+        Args:
+            worktree: Worktree whose row should be refreshed
+        """
+        table = self.query_one("#worktree-table", WorktreeTable)
+        table.update_status(worktree)
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection (click/Enter)."""
         self._select_current_row()
@@ -170,10 +271,7 @@ class WorktreeHeader(Vertical):
         """Programmatically select a worktree."""
         self.selected_worktree = worktree
         table = self.query_one("#worktree-table", WorktreeTable)
-        for i, wt in enumerate(table._worktrees):
-            if wt.name == worktree.name:
-                table.move_cursor(row=i)
-                break
+        table.move_to(worktree.name)
 
     def update_git_status(self, git_status: dict | None) -> None:
         """Update git status for selected worktree."""